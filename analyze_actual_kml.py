@@ -3,8 +3,24 @@
 Analyze the actual coordinates from the KML files to understand the discrepancy.
 """
 
+import argparse
+from functools import lru_cache
 from pyproj import Transformer
 import math
+import sys
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+
+
+# US Survey Foot = 1200/3937 meters (exact); keep the reciprocal so
+# meters -> feet is a multiply rather than a divide
+US_FT_TO_M = 1200.0 / 3937.0
+M_TO_US_FT = 3937.0 / 1200.0
+
 
 # WGS84 coordinates from the actual KML files
 CM_10_99_WGS84 = {
@@ -30,140 +46,160 @@ RW_STA_0_STATE_PLANE_METERS = {
     'elevation': 0.0
 }
 
-print("=" * 80)
-print("ANALYZING ACTUAL KML COORDINATES")
-print("=" * 80)
-print()
-
-# Convert WGS84 back to State Plane to see what's happening
-transformer_wgs84_to_2226 = Transformer.from_crs('EPSG:4326', 'EPSG:2226', always_xy=True)
-transformer_wgs84_to_2767 = Transformer.from_crs('EPSG:4326', 'EPSG:2767', always_xy=True)
-
-# Convert CM 10.99 from WGS84 back to State Plane
-cm_2226 = transformer_wgs84_to_2226.transform(CM_10_99_WGS84['lon'], CM_10_99_WGS84['lat'])
-cm_2767 = transformer_wgs84_to_2767.transform(CM_10_99_WGS84['lon'], CM_10_99_WGS84['lat'])
-
-print("CM 10.99 COORDINATES")
-print("-" * 80)
-print(f"Source (from CSV in feet):        E={CM_10_99_STATE_PLANE_FEET['easting']:12.2f}, N={CM_10_99_STATE_PLANE_FEET['northing']:12.2f}")
-print(f"WGS84 (from KML):                 Lon={CM_10_99_WGS84['lon']:.8f}, Lat={CM_10_99_WGS84['lat']:.8f}")
-print(f"Back to EPSG:2226 (ft):           E={cm_2226[0]:12.2f}, N={cm_2226[1]:12.2f}")
-print(f"Back to EPSG:2767 (m):            E={cm_2767[0]:12.2f}, N={cm_2767[1]:12.2f}")
-print()
-
-# Convert RW Sta 0 from WGS84 back to State Plane
-rw_2226 = transformer_wgs84_to_2226.transform(RW_STA_0_WGS84['lon'], RW_STA_0_WGS84['lat'])
-rw_2767 = transformer_wgs84_to_2767.transform(RW_STA_0_WGS84['lon'], RW_STA_0_WGS84['lat'])
-
-print("RW Sta 0+000.00 COORDINATES")
-print("-" * 80)
-print(f"Source (from IFC in meters):      E={RW_STA_0_STATE_PLANE_METERS['easting']:12.2f}, N={RW_STA_0_STATE_PLANE_METERS['northing']:12.2f}")
-print(f"WGS84 (from KML):                 Lon={RW_STA_0_WGS84['lon']:.8f}, Lat={RW_STA_0_WGS84['lat']:.8f}")
-print(f"Back to EPSG:2226 (ft):           E={rw_2226[0]:12.2f}, N={rw_2226[1]:12.2f}")
-print(f"Back to EPSG:2767 (m):            E={rw_2767[0]:12.2f}, N={rw_2767[1]:12.2f}")
-print()
-
-# Now calculate distances in State Plane (meters)
-us_ft_to_m = 0.3048006096012192
-
-# CM in meters
-cm_meters = (cm_2767[0], cm_2767[1])
-
-# RW in meters
-rw_meters = (rw_2767[0], rw_2767[1])
-
-dx = rw_meters[0] - cm_meters[0]
-dy = rw_meters[1] - cm_meters[1]
-dist_m = math.sqrt(dx**2 + dy**2)
-dist_ft = dist_m / us_ft_to_m
-
-print("DISTANCE CALCULATION (using WGS84 -> EPSG:2767 conversion)")
-print("-" * 80)
-print(f"CM 10.99:        E={cm_meters[0]:12.2f} m, N={cm_meters[1]:12.2f} m")
-print(f"RW Sta 0+000.00: E={rw_meters[0]:12.2f} m, N={rw_meters[1]:12.2f} m")
-print(f"ΔE: {dx:10.2f} m")
-print(f"ΔN: {dy:10.2f} m")
-print(f"Distance: {dist_m:.2f} m = {dist_ft:.2f} ft")
-print()
-
-# Now let's check - what if we compare the original coordinates directly?
-print("=" * 80)
-print("PROBLEM DIAGNOSIS")
-print("=" * 80)
-print()
-
-# Convert CM from feet to meters
-cm_orig_to_meters = {
-    'easting': CM_10_99_STATE_PLANE_FEET['easting'] * us_ft_to_m,
-    'northing': CM_10_99_STATE_PLANE_FEET['northing'] * us_ft_to_m
-}
 
-dx_orig = RW_STA_0_STATE_PLANE_METERS['easting'] - cm_orig_to_meters['easting']
-dy_orig = RW_STA_0_STATE_PLANE_METERS['northing'] - cm_orig_to_meters['northing']
-dist_orig_m = math.sqrt(dx_orig**2 + dy_orig**2)
-dist_orig_ft = dist_orig_m / us_ft_to_m
-
-print("Direct comparison of source coordinates (CM converted ft->m):")
-print(f"CM 10.99:        E={cm_orig_to_meters['easting']:12.2f} m, N={cm_orig_to_meters['northing']:12.2f} m")
-print(f"RW Sta 0+000.00: E={RW_STA_0_STATE_PLANE_METERS['easting']:12.2f} m, N={RW_STA_0_STATE_PLANE_METERS['northing']:12.2f} m")
-print(f"Distance: {dist_orig_m:.2f} m = {dist_orig_ft:.2f} ft")
-print()
-
-# Key insight: Check if control points were converted with wrong CRS
-print("HYPOTHESIS: Control Points KML used wrong source CRS")
-print("-" * 80)
-print()
-
-# What if the Control Points KML was created assuming the feet coordinates
-# were already in meters (EPSG:2767)?
-transformer_2767_to_4326 = Transformer.from_crs('EPSG:2767', 'EPSG:4326', always_xy=True)
-
-# Treat the feet values as if they were meters
-cm_wrong_wgs84 = transformer_2767_to_4326.transform(
-    CM_10_99_STATE_PLANE_FEET['easting'],
-    CM_10_99_STATE_PLANE_FEET['northing']
-)
-
-print("If Control Points CSV (in feet) was incorrectly treated as meters:")
-print(f"  Input:  E={CM_10_99_STATE_PLANE_FEET['easting']:.2f} ft, N={CM_10_99_STATE_PLANE_FEET['northing']:.2f} ft")
-print(f"  Treated as: E={CM_10_99_STATE_PLANE_FEET['easting']:.2f} m, N={CM_10_99_STATE_PLANE_FEET['northing']:.2f} m")
-print(f"  Result WGS84: Lon={cm_wrong_wgs84[0]:.8f}, Lat={cm_wrong_wgs84[1]:.8f}")
-print(f"  Actual WGS84: Lon={CM_10_99_WGS84['lon']:.8f}, Lat={CM_10_99_WGS84['lat']:.8f}")
-print()
-
-if abs(cm_wrong_wgs84[0] - CM_10_99_WGS84['lon']) < 0.0001:
-    print("MATCH! The Control Points KML incorrectly treated feet as meters!")
+def main(diagnose=False):
+    """Print the KML coordinate analysis; diagnose adds the wrong-CRS hypothesis test."""
+    print("=" * 80)
+    print("ANALYZING ACTUAL KML COORDINATES")
+    print("=" * 80)
+    print()
+
+    # Convert WGS84 back to State Plane to see what's happening
+    transformer_wgs84_to_2226 = get_transformer('EPSG:4326', 'EPSG:2226')
+    transformer_wgs84_to_2767 = get_transformer('EPSG:4326', 'EPSG:2767')
+
+    # Convert CM 10.99 and RW Sta 0 from WGS84 back to State Plane with one
+    # batched call per CRS pair (index 0 = CM 10.99, index 1 = RW Sta 0)
+    kml_lons = [CM_10_99_WGS84['lon'], RW_STA_0_WGS84['lon']]
+    kml_lats = [CM_10_99_WGS84['lat'], RW_STA_0_WGS84['lat']]
+    xs_2226, ys_2226 = transformer_wgs84_to_2226.transform(kml_lons, kml_lats)
+    xs_2767, ys_2767 = transformer_wgs84_to_2767.transform(kml_lons, kml_lats)
+
+    cm_2226 = (xs_2226[0], ys_2226[0])
+    cm_2767 = (xs_2767[0], ys_2767[0])
+
+    print("CM 10.99 COORDINATES")
+    print("-" * 80)
+    print(f"Source (from CSV in feet):        E={CM_10_99_STATE_PLANE_FEET['easting']:12.2f}, N={CM_10_99_STATE_PLANE_FEET['northing']:12.2f}")
+    print(f"WGS84 (from KML):                 Lon={CM_10_99_WGS84['lon']:.8f}, Lat={CM_10_99_WGS84['lat']:.8f}")
+    print(f"Back to EPSG:2226 (ft):           E={cm_2226[0]:12.2f}, N={cm_2226[1]:12.2f}")
+    print(f"Back to EPSG:2767 (m):            E={cm_2767[0]:12.2f}, N={cm_2767[1]:12.2f}")
+    print()
+
+    rw_2226 = (xs_2226[1], ys_2226[1])
+    rw_2767 = (xs_2767[1], ys_2767[1])
+
+    print("RW Sta 0+000.00 COORDINATES")
+    print("-" * 80)
+    print(f"Source (from IFC in meters):      E={RW_STA_0_STATE_PLANE_METERS['easting']:12.2f}, N={RW_STA_0_STATE_PLANE_METERS['northing']:12.2f}")
+    print(f"WGS84 (from KML):                 Lon={RW_STA_0_WGS84['lon']:.8f}, Lat={RW_STA_0_WGS84['lat']:.8f}")
+    print(f"Back to EPSG:2226 (ft):           E={rw_2226[0]:12.2f}, N={rw_2226[1]:12.2f}")
+    print(f"Back to EPSG:2767 (m):            E={rw_2767[0]:12.2f}, N={rw_2767[1]:12.2f}")
+    print()
+
+    # Now calculate distances in State Plane (meters)
+    # CM in meters
+    cm_meters = (cm_2767[0], cm_2767[1])
+
+    # RW in meters
+    rw_meters = (rw_2767[0], rw_2767[1])
+
+    dx = rw_meters[0] - cm_meters[0]
+    dy = rw_meters[1] - cm_meters[1]
+    dist_m = math.hypot(dx, dy)
+    dist_ft = dist_m * M_TO_US_FT
+
+    print("DISTANCE CALCULATION (using WGS84 -> EPSG:2767 conversion)")
+    print("-" * 80)
+    print(f"CM 10.99:        E={cm_meters[0]:12.2f} m, N={cm_meters[1]:12.2f} m")
+    print(f"RW Sta 0+000.00: E={rw_meters[0]:12.2f} m, N={rw_meters[1]:12.2f} m")
+    print(f"ΔE: {dx:10.2f} m")
+    print(f"ΔN: {dy:10.2f} m")
+    print(f"Distance: {dist_m:.2f} m = {dist_ft:.2f} ft")
+    print()
+
+    # Now let's check - what if we compare the original coordinates directly?
+    print("=" * 80)
+    print("PROBLEM DIAGNOSIS")
+    print("=" * 80)
+    print()
+
+    # Convert CM from feet to meters
+    cm_orig_to_meters = {
+        'easting': CM_10_99_STATE_PLANE_FEET['easting'] * US_FT_TO_M,
+        'northing': CM_10_99_STATE_PLANE_FEET['northing'] * US_FT_TO_M
+    }
+
+    dx_orig = RW_STA_0_STATE_PLANE_METERS['easting'] - cm_orig_to_meters['easting']
+    dy_orig = RW_STA_0_STATE_PLANE_METERS['northing'] - cm_orig_to_meters['northing']
+    dist_orig_m = math.hypot(dx_orig, dy_orig)
+    dist_orig_ft = dist_orig_m * M_TO_US_FT
+
+    print("Direct comparison of source coordinates (CM converted ft->m):")
+    print(f"CM 10.99:        E={cm_orig_to_meters['easting']:12.2f} m, N={cm_orig_to_meters['northing']:12.2f} m")
+    print(f"RW Sta 0+000.00: E={RW_STA_0_STATE_PLANE_METERS['easting']:12.2f} m, N={RW_STA_0_STATE_PLANE_METERS['northing']:12.2f} m")
+    print(f"Distance: {dist_orig_m:.2f} m = {dist_orig_ft:.2f} ft")
+    print()
+
+    # Key insight: Check if control points were converted with wrong CRS.
+    # Only run with --diagnose; batch runs skip the extra transform.
+    if diagnose:
+        print("HYPOTHESIS: Control Points KML used wrong source CRS")
+        print("-" * 80)
+        print()
+
+        # What if the Control Points KML was created assuming the feet coordinates
+        # were already in meters (EPSG:2767)?
+        transformer_2767_to_4326 = get_transformer('EPSG:2767', 'EPSG:4326')
+
+        # Treat the feet values as if they were meters
+        cm_wrong_wgs84 = transformer_2767_to_4326.transform(
+            CM_10_99_STATE_PLANE_FEET['easting'],
+            CM_10_99_STATE_PLANE_FEET['northing']
+        )
+
+        print("If Control Points CSV (in feet) was incorrectly treated as meters:")
+        print(f"  Input:  E={CM_10_99_STATE_PLANE_FEET['easting']:.2f} ft, N={CM_10_99_STATE_PLANE_FEET['northing']:.2f} ft")
+        print(f"  Treated as: E={CM_10_99_STATE_PLANE_FEET['easting']:.2f} m, N={CM_10_99_STATE_PLANE_FEET['northing']:.2f} m")
+        print(f"  Result WGS84: Lon={cm_wrong_wgs84[0]:.8f}, Lat={cm_wrong_wgs84[1]:.8f}")
+        print(f"  Actual WGS84: Lon={CM_10_99_WGS84['lon']:.8f}, Lat={CM_10_99_WGS84['lat']:.8f}")
+        print()
+
+        if abs(cm_wrong_wgs84[0] - CM_10_99_WGS84['lon']) < 0.0001:
+            print("MATCH! The Control Points KML incorrectly treated feet as meters!")
+            print()
+            print("This means:")
+            print("  1. The Control Points are being placed at the wrong location")
+            print("  2. The scaling factor is ~3.28 (ft/m), causing the ~2-3x error")
+            print("  3. We need to fix the Control Points KML creation process")
+        else:
+            print("No match - different issue")
+        print()
+
+    # Calculate the actual distance if both were correctly converted
+    print("=" * 80)
+    print("CORRECT DISTANCE CALCULATION")
+    print("=" * 80)
+    print()
+
+    # Correct coordinates for both
+    transformer_2226_to_2767 = get_transformer('EPSG:2226', 'EPSG:2767')
+
+    cm_correct = transformer_2226_to_2767.transform(
+        CM_10_99_STATE_PLANE_FEET['easting'],
+        CM_10_99_STATE_PLANE_FEET['northing']
+    )
+
+    print("Correctly converted coordinates:")
+    print(f"CM 10.99 (from EPSG:2226 ft):     E={cm_correct[0]:12.2f} m, N={cm_correct[1]:12.2f} m")
+    print(f"RW Sta 0+000.00 (from IFC):       E={RW_STA_0_STATE_PLANE_METERS['easting']:12.2f} m, N={RW_STA_0_STATE_PLANE_METERS['northing']:12.2f} m")
+
+    dx_correct = RW_STA_0_STATE_PLANE_METERS['easting'] - cm_correct[0]
+    dy_correct = RW_STA_0_STATE_PLANE_METERS['northing'] - cm_correct[1]
+    dist_correct_m = math.hypot(dx_correct, dy_correct)
+    dist_correct_ft = dist_correct_m * M_TO_US_FT
+
+    print(f"Distance: {dist_correct_m:.2f} m = {dist_correct_ft:.2f} ft")
     print()
-    print("This means:")
-    print("  1. The Control Points are being placed at the wrong location")
-    print("  2. The scaling factor is ~3.28 (ft/m), causing the ~2-3x error")
-    print("  3. We need to fix the Control Points KML creation process")
-else:
-    print("No match - different issue")
-print()
-
-# Calculate the actual distance if both were correctly converted
-print("=" * 80)
-print("CORRECT DISTANCE CALCULATION")
-print("=" * 80)
-print()
-
-# Correct coordinates for both
-transformer_2226_to_2767 = Transformer.from_crs('EPSG:2226', 'EPSG:2767', always_xy=True)
-
-cm_correct = transformer_2226_to_2767.transform(
-    CM_10_99_STATE_PLANE_FEET['easting'],
-    CM_10_99_STATE_PLANE_FEET['northing']
-)
-
-print("Correctly converted coordinates:")
-print(f"CM 10.99 (from EPSG:2226 ft):     E={cm_correct[0]:12.2f} m, N={cm_correct[1]:12.2f} m")
-print(f"RW Sta 0+000.00 (from IFC):       E={RW_STA_0_STATE_PLANE_METERS['easting']:12.2f} m, N={RW_STA_0_STATE_PLANE_METERS['northing']:12.2f} m")
-
-dx_correct = RW_STA_0_STATE_PLANE_METERS['easting'] - cm_correct[0]
-dy_correct = RW_STA_0_STATE_PLANE_METERS['northing'] - cm_correct[1]
-dist_correct_m = math.sqrt(dx_correct**2 + dy_correct**2)
-dist_correct_ft = dist_correct_m / us_ft_to_m
-
-print(f"Distance: {dist_correct_m:.2f} m = {dist_correct_ft:.2f} ft")
-print()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--diagnose', action='store_true',
+                        help="also test the 'Control Points used wrong source CRS' hypothesis")
+    args = parser.parse_args()
+
+    # Report is written with many small print() calls; don't flush after every
+    # line on a terminal, let the stream buffer them into a few large writes
+    sys.stdout.reconfigure(line_buffering=False)
+    main(args.diagnose)
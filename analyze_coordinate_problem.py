@@ -6,22 +6,31 @@ This script tests different transformation scenarios to determine why
 distances are off by approximately 2x (41 ft measured vs 83 ft expected).
 """
 
+from functools import lru_cache
 from pyproj import Transformer
 import math
+import sys
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+
+# US Survey Foot = 1200/3937 meters (exact)
+US_FT_TO_M = 1200.0 / 3937.0
+M_TO_US_FT = 3937.0 / 1200.0
 
 def calculate_distance_2d(x1, y1, x2, y2):
     """Calculate 2D Euclidean distance."""
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 def meters_to_feet(meters):
     """Convert meters to US Survey Feet."""
-    # US Survey Foot = 1200/3937 meters (exact)
-    return meters / (1200/3937)
+    return meters * M_TO_US_FT
 
 def feet_to_meters(feet):
     """Convert US Survey Feet to meters."""
-    # US Survey Foot = 1200/3937 meters (exact)
-    return feet * (1200/3937)
+    return feet * US_FT_TO_M
 
 def main():
     print("=" * 80)
@@ -65,7 +74,7 @@ def main():
 
     try:
         # Transform IFC point from EPSG:2767 (meters) to EPSG:2871 (feet)
-        transformer_m_to_f = Transformer.from_crs('EPSG:2767', 'EPSG:2871', always_xy=True)
+        transformer_m_to_f = get_transformer('EPSG:2767', 'EPSG:2871')
         rw_sta_easting_s1, rw_sta_northing_s1 = transformer_m_to_f.transform(rw_sta_x, rw_sta_y)
 
         print(f"\nTransformed RW Sta 0+032.67 to EPSG:2871:")
@@ -166,8 +175,8 @@ def main():
     print(f"   Ratio: {ratio:.4f}x")
 
     # Check if this ratio matches meter-to-foot conversion
-    meters_per_foot = 1200/3937  # US Survey Foot definition
-    feet_per_meter = 3937/1200
+    meters_per_foot = US_FT_TO_M  # US Survey Foot definition
+    feet_per_meter = M_TO_US_FT
 
     print(f"\nUS Survey Foot conversion factors:")
     print(f"   1 US Survey Foot = {meters_per_foot:.10f} meters")
@@ -227,23 +236,25 @@ def main():
     print("=" * 80)
 
     try:
-        # Transform CM 10.99 to WGS84
-        trans_cm_to_wgs = Transformer.from_crs('EPSG:2871', 'EPSG:4326', always_xy=True)
-        cm_lon, cm_lat = trans_cm_to_wgs.transform(cm_10_99_easting, cm_10_99_northing)
+        # Transform CM 10.99 and RW Sta (assuming it's in feet, EPSG:2871)
+        # to WGS84 in one batched call
+        trans_cm_to_wgs = get_transformer('EPSG:2871', 'EPSG:4326')
+        lons, lats = trans_cm_to_wgs.transform(
+            [cm_10_99_easting, rw_sta_x], [cm_10_99_northing, rw_sta_y]
+        )
+        cm_lon, rw_lon_s2 = lons
+        cm_lat, rw_lat_s2 = lats
 
         print(f"\nCM 10.99 in WGS84:")
         print(f"   Longitude: {cm_lon:.8f}")
         print(f"   Latitude:  {cm_lat:.8f}")
 
-        # Transform RW Sta assuming it's in feet (EPSG:2871)
-        rw_lon_s2, rw_lat_s2 = trans_cm_to_wgs.transform(rw_sta_x, rw_sta_y)
-
         print(f"\nRW Sta 0+032.67 in WGS84 (assuming EPSG:2871):")
         print(f"   Longitude: {rw_lon_s2:.8f}")
         print(f"   Latitude:  {rw_lat_s2:.8f}")
 
         # Transform RW Sta assuming it's in meters (EPSG:2767)
-        trans_rw_to_wgs = Transformer.from_crs('EPSG:2767', 'EPSG:4326', always_xy=True)
+        trans_rw_to_wgs = get_transformer('EPSG:2767', 'EPSG:4326')
         rw_lon_s1, rw_lat_s1 = trans_rw_to_wgs.transform(rw_sta_x, rw_sta_y)
 
         print(f"\nRW Sta 0+032.67 in WGS84 (assuming EPSG:2767):")
@@ -255,15 +266,18 @@ def main():
         from pyproj import Geod
         geod = Geod(ellps='WGS84')
 
-        # Distance for Scenario 2 (feet assumption)
-        _, _, dist_s2_wgs = geod.inv(cm_lon, cm_lat, rw_lon_s2, rw_lat_s2)
+        # Distances for Scenario 2 (feet assumption) and Scenario 1 (meters
+        # assumption) in one batched geodesic call
+        _, _, dists_wgs = geod.inv(
+            [cm_lon, cm_lon], [cm_lat, cm_lat],
+            [rw_lon_s2, rw_lon_s1], [rw_lat_s2, rw_lat_s1]
+        )
+        dist_s2_wgs, dist_s1_wgs = dists_wgs
         dist_s2_wgs_ft = dist_s2_wgs * 3.28084  # meters to international feet (approximate)
 
         print(f"\nDistance via WGS84 (Scenario 2 - feet assumption):")
         print(f"   {dist_s2_wgs:.2f} meters = {dist_s2_wgs_ft:.2f} feet")
 
-        # Distance for Scenario 1 (meters assumption)
-        _, _, dist_s1_wgs = geod.inv(cm_lon, cm_lat, rw_lon_s1, rw_lat_s1)
         dist_s1_wgs_ft = dist_s1_wgs * 3.28084
 
         print(f"\nDistance via WGS84 (Scenario 1 - meters assumption):")
@@ -275,4 +289,7 @@ def main():
     print("\n" + "=" * 80)
 
 if __name__ == '__main__':
+    # main() emits its report with many small print() calls; don't flush
+    # after every line on a terminal, let the stream batch the writes
+    sys.stdout.reconfigure(line_buffering=False)
     main()
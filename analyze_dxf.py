@@ -4,7 +4,21 @@ Analyze DXF file structure to understand entities and coordinate system.
 """
 
 import ezdxf
+import numpy as np
+import io
+import os
 import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+
+# Entity types that contribute to the coordinate range, mapped to the DXF
+# attribute holding their position
+LOCATION_ATTRIBS = {
+    'POINT': 'location',
+    'INSERT': 'insert',
+}
 
 def analyze_dxf(dxf_file):
     """Analyze a DXF file and print information about its contents."""
@@ -30,11 +44,21 @@ def analyze_dxf(dxf_file):
     # Get modelspace
     msp = doc.modelspace()
 
-    # Count entity types
-    entity_counts = {}
+    # Single pass over modelspace: bin entities by type and collect the
+    # POINT/INSERT coordinates for the range analysis
+    buckets = defaultdict(list)
+    all_x, all_y = array('d'), array('d')
     for entity in msp:
         entity_type = entity.dxftype()
-        entity_counts[entity_type] = entity_counts.get(entity_type, 0) + 1
+        buckets[entity_type].append(entity)
+        loc_attrib = LOCATION_ATTRIBS.get(entity_type)
+        if loc_attrib is None:
+            continue
+        loc = getattr(entity.dxf, loc_attrib)
+        all_x.append(loc.x)
+        all_y.append(loc.y)
+
+    entity_counts = {k: len(v) for k, v in buckets.items()}
 
     print("\n--- Entity Counts ---")
     for entity_type, count in sorted(entity_counts.items()):
@@ -44,19 +68,17 @@ def analyze_dxf(dxf_file):
     print("\n--- Sample Entities ---")
 
     # Look at POINT entities
-    points = list(msp.query('POINT'))
+    points = buckets['POINT']
     if points:
         print(f"\nFound {len(points)} POINT entities")
         print("First 5 points:")
         for i, point in enumerate(points[:5]):
             loc = point.dxf.location
             print(f"  Point {i+1}: X={loc.x:.2f}, Y={loc.y:.2f}, Z={loc.z:.2f}")
-            # Check for attributes
-            if hasattr(point.dxf, 'layer'):
-                print(f"    Layer: {point.dxf.layer}")
+            print(f"    Layer: {point.dxf.layer}")
 
     # Look at TEXT entities
-    texts = list(msp.query('TEXT'))
+    texts = buckets['TEXT']
     if texts:
         print(f"\nFound {len(texts)} TEXT entities")
         print("First 10 text labels:")
@@ -64,7 +86,7 @@ def analyze_dxf(dxf_file):
             print(f"  {i+1}. '{text.dxf.text}' at ({text.dxf.insert.x:.2f}, {text.dxf.insert.y:.2f})")
 
     # Look at MTEXT entities
-    mtexts = list(msp.query('MTEXT'))
+    mtexts = buckets['MTEXT']
     if mtexts:
         print(f"\nFound {len(mtexts)} MTEXT entities")
         print("First 10 mtext labels:")
@@ -73,7 +95,7 @@ def analyze_dxf(dxf_file):
             print(f"  {i+1}. '{text_content}' at ({mtext.dxf.insert.x:.2f}, {mtext.dxf.insert.y:.2f})")
 
     # Look for attribute definitions and block inserts
-    inserts = list(msp.query('INSERT'))
+    inserts = buckets['INSERT']
     if inserts:
         print(f"\nFound {len(inserts)} INSERT (block) entities")
         print("First 10 block inserts with attributes:")
@@ -90,30 +112,39 @@ def analyze_dxf(dxf_file):
 
     # Check coordinate range
     print("\n--- Coordinate Range Analysis ---")
-    all_x, all_y = [], []
-    for entity in msp:
-        if entity.dxftype() == 'POINT':
-            loc = entity.dxf.location
-            all_x.append(loc.x)
-            all_y.append(loc.y)
-        elif entity.dxftype() == 'INSERT':
-            loc = entity.dxf.insert
-            all_x.append(loc.x)
-            all_y.append(loc.y)
-
-    if all_x and all_y:
-        print(f"X range: {min(all_x):.2f} to {max(all_x):.2f}")
-        print(f"Y range: {min(all_y):.2f} to {max(all_y):.2f}")
+    if all_x:
+        xs = np.frombuffer(all_x, dtype=np.float64)
+        ys = np.frombuffer(all_y, dtype=np.float64)
+        xmin, xmax = xs.min(), xs.max()
+        ymin, ymax = ys.min(), ys.max()
+        print(f"X range: {xmin:.2f} to {xmax:.2f}")
+        print(f"Y range: {ymin:.2f} to {ymax:.2f}")
         print(f"\nCoordinate magnitudes suggest EPSG:2767 or EPSG:2871")
         print(f"(California State Plane Zone 2, around 2M easting, 600K-700K northing)")
 
+def analyze_dxf_report(dxf_file):
+    """Run analyze_dxf in a worker process and return its printed report as a string."""
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        try:
+            analyze_dxf(dxf_file)
+        except Exception as e:
+            print(f"ERROR analyzing {os.path.basename(dxf_file)}: {e}")
+    return buf.getvalue()
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        for dxf_file in sys.argv[1:]:
-            analyze_dxf(dxf_file)
+        dxf_files = sys.argv[1:]
     else:
         # Analyze all DXF files in DATA directory
         import glob
-        dxf_files = glob.glob("/home/user/03-3H51U4/DATA/*.dxf")
-        for dxf_file in sorted(dxf_files):
+        dxf_files = sorted(glob.glob("/home/user/03-3H51U4/DATA/*.dxf"))
+
+    if len(dxf_files) > 1:
+        # Files are independent: analyze them in parallel, print reports in order
+        with ProcessPoolExecutor(max_workers=min(len(dxf_files), os.cpu_count() or 1)) as executor:
+            for report in executor.map(analyze_dxf_report, dxf_files):
+                sys.stdout.write(report)
+    else:
+        for dxf_file in dxf_files:
             analyze_dxf(dxf_file)
@@ -9,9 +9,20 @@ What if the IFC coordinates are in FEET (EPSG:2871) but we're transforming them
 as if they're in METERS (EPSG:2767)?
 """
 
-from pyproj import Transformer
+from functools import lru_cache
+from pyproj import CRS, Transformer
 import math
 
+# Build the CRS objects once at import
+CRS_2767 = CRS.from_epsg(2767)  # CA State Plane Zone 2, meters
+CRS_2871 = CRS.from_epsg(2871)  # CA State Plane Zone 2, US Survey Feet
+CRS_WGS84 = CRS.from_epsg(4326)
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+
 def main():
     print("=" * 80)
     print("BREAKTHROUGH ANALYSIS: UNIT CONFUSION")
@@ -42,7 +53,7 @@ def main():
     print(f"  Northing: {cm_north_ft:.2f} ft")
 
     # Calculate distance directly
-    dist_a_ft = math.sqrt((cm_east_ft - rw_value_x)**2 + (cm_north_ft - rw_value_y)**2)
+    dist_a_ft = math.hypot(cm_east_ft - rw_value_x, cm_north_ft - rw_value_y)
 
     print(f"\nDistance (both in EPSG:2871):")
     print(f"  {dist_a_ft:.2f} ft")
@@ -57,14 +68,14 @@ def main():
     print("SCENARIO B: Current approach (treating IFC values as EPSG:2767 meters)")
     print("-" * 80)
 
-    trans_m_to_ft = Transformer.from_crs('EPSG:2767', 'EPSG:2871', always_xy=True)
+    trans_m_to_ft = get_transformer(CRS_2767, CRS_2871)
     rw_east_ft_b, rw_north_ft_b = trans_m_to_ft.transform(rw_value_x, rw_value_y)
 
     print(f"\nRW Sta 0+032.67 after transformation:")
     print(f"  Easting:  {rw_east_ft_b:.2f} ft")
     print(f"  Northing: {rw_north_ft_b:.2f} ft")
 
-    dist_b_ft = math.sqrt((cm_east_ft - rw_east_ft_b)**2 + (cm_north_ft - rw_north_ft_b)**2)
+    dist_b_ft = math.hypot(cm_east_ft - rw_east_ft_b, cm_north_ft - rw_north_ft_b)
 
     print(f"\nDistance:")
     print(f"  {dist_b_ft:.2f} ft")
@@ -81,7 +92,7 @@ def main():
     print(f"\nRW Sta 0+000.00 'Start Point' from IFC: {rw_000_x:.2f}, {rw_000_y:.2f}")
 
     # Scenario A: Treat as feet
-    dist_stations_a = math.sqrt((rw_value_x - rw_000_x)**2 + (rw_value_y - rw_000_y)**2)
+    dist_stations_a = math.hypot(rw_value_x - rw_000_x, rw_value_y - rw_000_y)
     print(f"\nDistance between stations (treating values as feet in EPSG:2871):")
     print(f"  {dist_stations_a:.2f} ft")
     print(f"  Station difference: 32.67 ft (from station numbers)")
@@ -93,7 +104,7 @@ def main():
 
     # Scenario B: Treat as meters, then convert
     rw_000_east_b, rw_000_north_b = trans_m_to_ft.transform(rw_000_x, rw_000_y)
-    dist_stations_b = math.sqrt((rw_east_ft_b - rw_000_east_b)**2 + (rw_north_ft_b - rw_000_north_b)**2)
+    dist_stations_b = math.hypot(rw_east_ft_b - rw_000_east_b, rw_north_ft_b - rw_000_north_b)
 
     print(f"\nDistance between stations (current wrong approach):")
     print(f"  {dist_stations_b:.2f} ft")
@@ -194,7 +205,7 @@ def main():
     print("=" * 80)
 
     # Transform using correct EPSG (2871)
-    trans_correct = Transformer.from_crs('EPSG:2871', 'EPSG:4326', always_xy=True)
+    trans_correct = get_transformer(CRS_2871, CRS_WGS84)
 
     # CM 10.99 to WGS84
     cm_lon, cm_lat = trans_correct.transform(cm_east_ft, cm_north_ft)
@@ -11,7 +11,16 @@ CSV Format:
 import csv
 import os
 import sys
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from pyproj import Transformer
+from pyproj.enums import TransformDirection
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
 
 
 def read_control_points(csv_file):
@@ -36,9 +45,7 @@ def read_control_points(csv_file):
             if len(row) >= 6:  # Make sure we have enough columns
                 try:
                     station_name = row[1].strip()
-                    northing = float(row[3])
-                    easting = float(row[4])
-                    elevation = float(row[5])
+                    northing, easting, elevation = map(float, row[3:6])
 
                     control_points.append({
                         'name': station_name,
@@ -53,33 +60,37 @@ def read_control_points(csv_file):
     return control_points
 
 
-def transform_point(easting, northing, elevation, source_epsg='EPSG:2871', target_epsg='EPSG:4326'):
+def transform_points(eastings, northings, elevations, source_epsg='EPSG:2871', target_epsg='EPSG:4326'):
     """
-    Transform a single point from source CRS to target CRS.
-    Transforms horizontal coordinates and converts elevation units.
+    Transform points from source CRS to target CRS in one call.
+    Transforms horizontal coordinates and converts elevation units; pyproj
+    transforms the whole sequence in a single C loop.
 
     Note: EPSG:2871 is a 2D horizontal CRS. Elevation values are treated as
     orthometric heights (NAVD88 or similar) and only require unit conversion.
 
     Args:
-        easting: Easting coordinate in source CRS (US Survey Feet)
-        northing: Northing coordinate in source CRS (US Survey Feet)
-        elevation: Elevation in US Survey Feet (orthometric height)
+        eastings: Sequence of easting coordinates in source CRS (US Survey Feet)
+        northings: Sequence of northing coordinates in source CRS (US Survey Feet)
+        elevations: Sequence of elevations in US Survey Feet (orthometric height)
         source_epsg: Source coordinate system (default: EPSG:2871 - CA State Plane Zone II)
         target_epsg: Target coordinate system (default: EPSG:4326 - WGS84)
 
     Returns:
-        Tuple of (longitude, latitude, elevation_meters)
-            - longitude: WGS84 longitude in decimal degrees
-            - latitude: WGS84 latitude in decimal degrees
-            - elevation_meters: Elevation in meters (unit conversion only, same vertical datum)
+        Tuple of (longitudes, latitudes, elevations_meters) lists
     """
-    transformer = Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
-    lon, lat = transformer.transform(easting, northing)
+    if source_epsg == target_epsg:
+        # Identity transform: nothing to project
+        lons, lats = list(eastings), list(northings)
+    else:
+        transformer = get_transformer(source_epsg, target_epsg)
+        lons, lats = transformer.transform(
+            list(eastings), list(northings), direction=TransformDirection.FORWARD
+        )
     # Convert elevation from US Survey Feet to meters (unit conversion only)
     # 1 US Survey Foot = 0.3048006096 meters
-    elev_meters = elevation * 0.3048006096
-    return lon, lat, elev_meters
+    elevs_meters = [elevation * 0.3048006096 for elevation in elevations]
+    return lons, lats, elevs_meters
 
 
 def create_kml(control_points, output_file):
@@ -90,8 +101,16 @@ def create_kml(control_points, output_file):
         control_points: List of control point dicts
         output_file: Path to output KML file
     """
-    # Build KML content
-    kml_content = '''<?xml version="1.0" encoding="UTF-8"?>
+    # Transform all control points in one batch
+    lons, lats, elevs_meters = transform_points(
+        [point['easting'] for point in control_points],
+        [point['northing'] for point in control_points],
+        [point['elevation'] for point in control_points]
+    )
+
+    # Write KML directly to the file as each placemark is generated
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write('''<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
     <name>Control Points</name>
@@ -110,17 +129,15 @@ def create_kml(control_points, output_file):
         <scale>0.9</scale>
       </LabelStyle>
     </Style>
-'''
+''')
 
-    # Transform and add each control point
-    for point in control_points:
-        lon, lat, elev_meters = transform_point(point['easting'], point['northing'], point['elevation'])
-        elevation_orig = point['elevation']
-        elev_ft = elev_meters * 3.28084  # Convert meters to feet for display
-        name = point['name']
+        for point, lon, lat, elev_meters in zip(control_points, lons, lats, elevs_meters):
+            elevation_orig = point['elevation']
+            elev_ft = elev_meters * 3.28084  # Convert meters to feet for display
+            name = point['name']
 
-        # Create description with coordinate info
-        description = f"""
+            # Create description with coordinate info
+            description = f"""
 Station: {name}
 Easting: {point['easting']:.3f} ft
 Northing: {point['northing']:.3f} ft
@@ -129,25 +146,21 @@ Elevation: {elev_meters:.2f} m ({elev_ft:.2f} ft)
 Note: Elevation is orthometric height (likely NAVD88)
 """
 
-        kml_content += f'''
+            f.write(f'''
     <Placemark>
-      <name>{name}</name>
-      <description>{description.strip()}</description>
+      <name>{escape(name)}</name>
+      <description>{escape(description.strip())}</description>
       <styleUrl>#controlPointStyle</styleUrl>
       <Point>
         <altitudeMode>clampToGround</altitudeMode>
         <coordinates>{lon},{lat},0</coordinates>
       </Point>
     </Placemark>
-'''
+''')
 
-    kml_content += '''  </Document>
+        f.write('''  </Document>
 </kml>
-'''
-
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(kml_content)
+''')
 
     print(f"Created KML file: {output_file}")
     print(f"  Control points: {len(control_points)}")
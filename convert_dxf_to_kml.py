@@ -5,79 +5,154 @@ Coordinates are in EPSG:2871 (NAD83(HARN) California Zone 2, US Survey Feet).
 """
 
 import ezdxf
-from pyproj import Transformer
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf.validator import is_binary_dxf_file
+import numpy as np
+from pyproj import CRS, Transformer
+from pyproj.enums import TransformDirection
 import sys
 import os
-import math
+import io
 import argparse
+import traceback
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache, partial
+from string import Template
+from xml.sax.saxutils import escape
+
+# Parse the fixed source/target CRS definitions once at import instead of
+# looking them up in the PROJ database for every transformer
+SOURCE_CRS = CRS.from_epsg(2871)  # NAD83(HARN) / California zone 2 (ftUS)
+TARGET_CRS = CRS.from_epsg(4326)  # WGS84
+
+# Document header and shared styles, written once per KML file
+KML_HEADER = Template('''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+<Document>
+    <name>$name</name>
+    <description>$description</description>
+
+    <Style id="pointStyle">
+        <IconStyle>
+            <color>ff0000ff</color>
+            <scale>0.6</scale>
+            <Icon>
+                <href>http://maps.google.com/mapfiles/kml/shapes/placemark_circle.png</href>
+            </Icon>
+        </IconStyle>
+        <LabelStyle>
+            <scale>0.7</scale>
+        </LabelStyle>
+    </Style>
+
+    <Style id="lineStyle">
+        <LineStyle>
+            <color>ff0000ff</color>
+            <width>2</width>
+        </LineStyle>
+    </Style>
+''')
+
+# Per-feature Placemark templates, filled with str.format in create_kml
+POINT_PLACEMARK = '''
+        <Placemark>
+            <name>{name}</name>
+            <description>
+                Layer: {layer}
+                Elevation: {elev:.2f} m ({elev_ft:.2f} ft)
+                Original Coords (EPSG:2871): ({x:.2f}, {y:.2f}, {z:.2f}) ft
+                Note: Elevation is orthometric height (likely NAVD88)
+            </description>
+            <styleUrl>#pointStyle</styleUrl>
+            <Point>
+                <altitudeMode>clampToGround</altitudeMode>
+                <coordinates>{lon:.10f},{lat:.10f},0</coordinates>
+            </Point>
+        </Placemark>
+'''
+
+POLYLINE_PLACEMARK_START = '''
+        <Placemark>
+            <name>Polyline {number}</name>
+            <description>{n_vertices} vertices</description>
+            <styleUrl>#lineStyle</styleUrl>
+            <LineString>
+                <altitudeMode>{altitude_mode}</altitudeMode>
+                <coordinates>
+'''
 
-def get_transformer(source_epsg='EPSG:2871', target_epsg='EPSG:4326'):
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg=SOURCE_CRS, target_epsg=TARGET_CRS):
     """
     Create a 2D coordinate transformer for horizontal coordinates.
+    Transformers are cached, so each CRS pair is only built once per process.
 
     Note: EPSG:2871 is a 2D horizontal CRS without vertical datum specification.
     Elevation values are treated as orthometric heights (NAVD88 or similar) and
     only require unit conversion (US Survey Feet to meters), not datum transformation.
 
     Args:
-        source_epsg: Source coordinate system (default: EPSG:2871)
-        target_epsg: Target coordinate system (default: WGS84)
+        source_epsg: Source coordinate system, EPSG code or CRS (default: EPSG:2871)
+        target_epsg: Target coordinate system, EPSG code or CRS (default: WGS84)
 
     Returns:
         Transformer object for 2D horizontal transformation
     """
     return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
 
-def transform_point(x, y, z, transformer):
+def transform_points(xs, ys, zs, transformer):
     """
-    Transform coordinates from EPSG:2871 (US Survey Feet) to WGS84.
-    Transforms horizontal coordinates and converts elevation units.
+    Transform arrays of coordinates from EPSG:2871 (US Survey Feet) to WGS84.
+    Transforms horizontal coordinates in one pyproj call and converts
+    elevation units (same vertical datum).
 
     Args:
-        x: Easting in US Survey Feet
-        y: Northing in US Survey Feet
-        z: Elevation in US Survey Feet (orthometric height, likely NAVD88)
+        xs: Eastings in US Survey Feet (array-like)
+        ys: Northings in US Survey Feet (array-like)
+        zs: Elevations in US Survey Feet (array-like, orthometric height)
         transformer: pyproj Transformer object for 2D horizontal transformation
 
     Returns:
-        tuple: (longitude, latitude, elevation_meters)
-            - longitude: WGS84 longitude in decimal degrees
-            - latitude: WGS84 latitude in decimal degrees
-            - elevation_meters: Elevation in meters (unit conversion only, same vertical datum)
+        tuple: (longitudes, latitudes, elevations_meters) as float64 arrays
     """
-    # Transform horizontal coordinates (2D)
-    lon, lat = transformer.transform(x, y)
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    zs = np.asarray(zs, dtype=np.float64)
+
+    # Transform horizontal coordinates (2D), skipping PROJ entirely for an
+    # identity transform
+    if transformer.source_crs == transformer.target_crs:
+        lons, lats = xs, ys
+    else:
+        lons, lats = transformer.transform(xs, ys, direction=TransformDirection.FORWARD)
 
     # Convert elevation from US Survey Feet to meters (unit conversion only)
     # 1 US Survey Foot = 0.3048006096 meters
-    elev_meters = z * 0.3048006096
+    elevs_meters = zs * 0.3048006096
 
-    return lon, lat, elev_meters
+    return lons, lats, elevs_meters
 
-def calculate_cumulative_distances(points):
+def calculate_cumulative_distances(xs, ys):
     """
     Calculate cumulative distance along a series of points.
 
     Args:
-        points: List of tuples (x, y, z, layer)
+        xs: Eastings in feet (array-like)
+        ys: Northings in feet (array-like)
 
     Returns:
-        list: Cumulative distances in feet
+        numpy.ndarray: Cumulative distances in feet
     """
-    if not points:
-        return []
-
-    distances = [0.0]  # First point is at distance 0
-
-    for i in range(1, len(points)):
-        x1, y1, z1, _ = points[i-1]
-        x2, y2, z2, _ = points[i]
-
-        # Calculate 2D distance (x, y only)
-        dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-        distances.append(distances[-1] + dist)
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    if xs.size == 0:
+        return np.empty(0)
 
-    return distances
+    # 2D segment lengths (x, y only); first point is at distance 0
+    segments = np.hypot(np.diff(xs), np.diff(ys))
+    return np.concatenate(([0.0], np.cumsum(segments)))
 
 def format_station(station_feet):
     """
@@ -93,69 +168,102 @@ def format_station(station_feet):
     feet = station_feet % 100
     return f"{hundreds}+{feet:05.2f}"
 
-def extract_points_from_dxf(dxf_file):
+def format_stations(stations_feet):
     """
-    Extract point entities from DXF file.
+    Format an array of station values in standard civil engineering format.
+    Vectorized counterpart of format_station(): the hundreds/feet split is
+    done with NumPy for all stations at once.
 
     Args:
-        dxf_file: Path to DXF file
+        stations_feet: Array-like of stations in feet
 
     Returns:
-        list: List of tuples (x, y, z, layer)
+        list: Formatted stations (e.g., ["100+48.77", ...])
     """
-    print(f"Reading DXF file: {dxf_file}")
-    doc = ezdxf.readfile(dxf_file)
-    msp = doc.modelspace()
+    stations_feet = np.asarray(stations_feet, dtype=np.float64)
+    hundreds = np.floor_divide(stations_feet, 100).astype(np.int64)
+    feet = np.mod(stations_feet, 100)
+    return [f"{h}+{ft:05.2f}" for h, ft in zip(hundreds.tolist(), feet.tolist())]
 
-    points = []
-    point_entities = list(msp.query('POINT'))
-
-    print(f"Found {len(point_entities)} POINT entities")
+def iter_modelspace(dxf_file):
+    """
+    Yield the modelspace entities of a DXF file.
 
-    for entity in point_entities:
-        loc = entity.dxf.location
-        layer = entity.dxf.layer if hasattr(entity.dxf, 'layer') else '0'
-        points.append((loc.x, loc.y, loc.z, layer))
+    ASCII files are streamed with ezdxf's iterdxf add-on, so the full DXF
+    document is never loaded into memory. iterdxf cannot parse binary DXF,
+    so binary files are loaded with ezdxf.readfile instead.
+    """
+    if is_binary_dxf_file(dxf_file):
+        yield from ezdxf.readfile(dxf_file).modelspace()
+        return
 
-    return points
+    doc = iterdxf.opendxf(dxf_file)
+    try:
+        yield from doc.modelspace()
+    finally:
+        doc.close()
 
-def extract_polylines_from_dxf(dxf_file):
+def extract_entities_from_dxf(dxf_file):
     """
-    Extract polyline entities from DXF file.
+    Extract point and polyline entities from DXF file in a single pass
+    over modelspace (see iter_modelspace).
 
     Args:
         dxf_file: Path to DXF file
 
     Returns:
-        list: List of polylines, each containing list of (x, y, z) tuples
+        tuple: (points, polylines)
+            - points: Tuple (xs, ys, zs, layers) of float64 coordinate arrays
+              and a list of layer names, one entry per POINT entity
+            - polylines: List of polylines, each containing list of (x, y, z) tuples
     """
-    doc = ezdxf.readfile(dxf_file)
-    msp = doc.modelspace()
+    print(f"Reading DXF file: {dxf_file}")
 
+    # POINT coordinates are kept as raw doubles rather than per-point tuples
+    xs, ys, zs = array('d'), array('d'), array('d')
+    layers = []
     polylines = []
 
-    # Get LWPOLYLINE entities (lightweight polylines)
-    for entity in msp.query('LWPOLYLINE'):
-        coords = []
-        for point in entity.get_points():
-            # LWPOLYLINE points are (x, y) or (x, y, z) tuples
-            x, y = point[0], point[1]
-            z = point[2] if len(point) > 2 else 0
-            coords.append((x, y, z))
-        if coords:
-            polylines.append(coords)
-
-    # Get POLYLINE entities (3D polylines)
-    for entity in msp.query('POLYLINE'):
-        coords = []
-        for vertex in entity.vertices:
-            loc = vertex.dxf.location
-            coords.append((loc.x, loc.y, loc.z))
-        if coords:
-            polylines.append(coords)
+    for entity in iter_modelspace(dxf_file):
+        entity_type = entity.dxftype()
+
+        if entity_type == 'POINT':
+            loc = entity.dxf.location
+            xs.append(loc.x)
+            ys.append(loc.y)
+            zs.append(loc.z)
+            layers.append(entity.dxf.layer)
+
+        elif entity_type == 'LWPOLYLINE':
+            # LWPOLYLINE entities (lightweight polylines)
+            coords = []
+            for point in entity.get_points():
+                # LWPOLYLINE points are (x, y) or (x, y, z) tuples
+                x, y = point[0], point[1]
+                z = point[2] if len(point) > 2 else 0
+                coords.append((x, y, z))
+            if coords:
+                polylines.append(coords)
+
+        elif entity_type == 'POLYLINE':
+            # POLYLINE entities (3D polylines)
+            coords = []
+            for vertex in entity.vertices:
+                loc = vertex.dxf.location
+                coords.append((loc.x, loc.y, loc.z))
+            if coords:
+                polylines.append(coords)
+
+    points = (
+        np.frombuffer(xs, dtype=np.float64),
+        np.frombuffer(ys, dtype=np.float64),
+        np.frombuffer(zs, dtype=np.float64),
+        layers
+    )
 
+    print(f"Found {len(layers)} POINT entities")
     print(f"Found {len(polylines)} polyline entities")
-    return polylines
+    return points, polylines
 
 def create_kml(points, polylines, output_file, file_description, start_station=None, end_station=None,
                include_stations=False, polyline_elevation=False):
@@ -163,7 +271,7 @@ def create_kml(points, polylines, output_file, file_description, start_station=N
     Create KML file from points and polylines.
 
     Args:
-        points: List of tuples (x, y, z, layer)
+        points: Tuple (xs, ys, zs, layers) as returned by extract_entities_from_dxf
         polylines: List of polylines
         output_file: Output KML file path
         file_description: Description for the KML file
@@ -172,6 +280,9 @@ def create_kml(points, polylines, output_file, file_description, start_station=N
         include_stations: If True, include station values in point names
         polyline_elevation: If True, render polylines at elevation (absolute altitude mode)
     """
+    xs, ys, zs, layers = points
+    n_points = len(layers)
+
     # Create transformer once and reuse
     print(f"  Creating coordinate transformer...")
     transformer = get_transformer()
@@ -179,9 +290,9 @@ def create_kml(points, polylines, output_file, file_description, start_station=N
     # Calculate cumulative distances for station interpolation
     cumulative_distances = None
     total_distance = None
-    if points and start_station is not None and end_station is not None and include_stations:
+    if n_points and start_station is not None and end_station is not None and include_stations:
         print(f"  Calculating cumulative distances...")
-        cumulative_distances = calculate_cumulative_distances(points)
+        cumulative_distances = calculate_cumulative_distances(xs, ys)
         total_distance = cumulative_distances[-1]
         expected_distance = end_station - start_station
         print(f"  Total distance: {total_distance:.2f} feet")
@@ -194,151 +305,121 @@ def create_kml(points, polylines, output_file, file_description, start_station=N
             print(f"  WARNING: Measured distance ({total_distance:.2f} ft) differs from station range ({expected_distance:.2f} ft) by {distance_diff:.2f} ft")
             print(f"           This may indicate incorrect station values or non-linear alignment")
 
-    # Use list for efficient string building
-    kml_parts = []
-
-    kml_parts.append(f'''<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2">
-<Document>
-    <name>{os.path.basename(output_file)}</name>
-    <description>{file_description}</description>
-
-    <Style id="pointStyle">
-        <IconStyle>
-            <color>ff0000ff</color>
-            <scale>0.6</scale>
-            <Icon>
-                <href>http://maps.google.com/mapfiles/kml/shapes/placemark_circle.png</href>
-            </Icon>
-        </IconStyle>
-        <LabelStyle>
-            <scale>0.7</scale>
-        </LabelStyle>
-    </Style>
-
-    <Style id="lineStyle">
-        <LineStyle>
-            <color>ff0000ff</color>
-            <width>2</width>
-        </LineStyle>
-    </Style>
-''')
-
-    # Add points folder
-    if points:
-        print(f"  Processing {len(points)} points...")
-        kml_parts.append(f'''
+    # Write KML straight to the file as it is generated; the buffered
+    # writer coalesces the small writes and nothing is held in memory
+    print(f"  Writing KML file...")
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(KML_HEADER.substitute(
+            name=escape(os.path.basename(output_file)),
+            description=escape(file_description)
+        ))
+
+        # Add points folder
+        if n_points:
+            print(f"  Processing {n_points} points...")
+            f.write(f'''
     <Folder>
         <name>Retaining Wall Points</name>
-        <description>{len(points)} retaining wall points</description>
+        <description>{n_points} retaining wall points</description>
         <open>1</open>
 ''')
 
-        for i, (x, y, z, layer) in enumerate(points):
-            if i % 100 == 0 and i > 0:
-                print(f"    Processed {i}/{len(points)} points...")
-
-            lon, lat, elev = transform_point(x, y, z, transformer)
+            # Transform all points in one batch
+            lons, lats, elevs = transform_points(xs, ys, zs, transformer)
 
-            # Calculate elevation in feet for display
-            elev_ft = elev * 3.28084  # Convert meters to feet
-
-            # Calculate point name
+            # Calculate station labels for all points at once
             if include_stations:
-                # Calculate station value
-                if start_station is not None and end_station is not None and cumulative_distances:
+                if start_station is not None and end_station is not None and cumulative_distances is not None:
                     # Calculate station by adding cumulative distance to start station
                     # This gives the actual station value based on measured distance
-                    station_ft = start_station + cumulative_distances[i]
-                    station_str = format_station(station_ft)
+                    stations_ft = start_station + cumulative_distances
                 else:
                     # Fallback to approximate station based on index
-                    station_ft = i * 8.0  # Approximate 8-foot spacing
-                    station_str = format_station(station_ft)
-                point_name = f"RW Sta {station_str}"
-            else:
-                point_name = f"Point {i+1}"
-
-            kml_parts.append(f'''
-        <Placemark>
-            <name>{point_name}</name>
-            <description>
-                Layer: {layer}
-                Elevation: {elev:.2f} m ({elev_ft:.2f} ft)
-                Original Coords (EPSG:2871): ({x:.2f}, {y:.2f}, {z:.2f}) ft
-                Note: Elevation is orthometric height (likely NAVD88)
-            </description>
-            <styleUrl>#pointStyle</styleUrl>
-            <Point>
-                <altitudeMode>clampToGround</altitudeMode>
-                <coordinates>{lon:.10f},{lat:.10f},0</coordinates>
-            </Point>
-        </Placemark>
-''')
+                    stations_ft = np.arange(n_points) * 8.0  # Approximate 8-foot spacing
+                station_strs = format_stations(stations_ft)
 
-        kml_parts.append('''    </Folder>
+            # Calculate point names up front
+            if include_stations:
+                point_names = [f"RW Sta {s}" for s in station_strs]
+            else:
+                point_names = [f"Point {i+1}" for i in range(n_points)]
+
+            # Bind hot-loop lookups to locals and iterate plain Python floats
+            write = f.write
+            format_point = POINT_PLACEMARK.format
+            for point_name, x, y, z, layer, lon, lat, elev in zip(
+                point_names, xs.tolist(), ys.tolist(), zs.tolist(), layers,
+                lons.tolist(), lats.tolist(), elevs.tolist()
+            ):
+                # Calculate elevation in feet for display
+                elev_ft = elev * 3.28084  # Convert meters to feet
+
+                write(format_point(
+                    name=point_name, layer=escape(layer), elev=elev, elev_ft=elev_ft,
+                    x=x, y=y, z=z, lon=lon, lat=lat
+                ))
+
+            f.write('''    </Folder>
 ''')
 
-    # Add polylines folder
-    if polylines:
-        print(f"  Processing {len(polylines)} polylines...")
-        kml_parts.append(f'''
+        # Add polylines folder
+        if polylines:
+            print(f"  Processing {len(polylines)} polylines...")
+            f.write(f'''
     <Folder>
         <name>Polylines</name>
         <description>{len(polylines)} polyline entities</description>
         <open>1</open>
 ''')
 
-        for i, coords in enumerate(polylines):
-            if i % 10 == 0 and i > 0:
-                print(f"    Processed {i}/{len(polylines)} polylines...")
+            # Transform every polyline vertex in one batch, then split the
+            # results back into per-polyline arrays
+            lengths = [len(coords) for coords in polylines]
+            flat_xyz = np.concatenate([np.asarray(coords, dtype=np.float64) for coords in polylines])
+            flat_lons, flat_lats, flat_elevs = transform_points(
+                flat_xyz[:, 0], flat_xyz[:, 1], flat_xyz[:, 2], transformer
+            )
+            split_at = np.cumsum(lengths)[:-1]
+            polyline_lons = np.split(flat_lons, split_at)
+            polyline_lats = np.split(flat_lats, split_at)
+            polyline_elevs = np.split(flat_elevs, split_at)
 
-            # Set altitude mode based on flag
-            altitude_mode = 'absolute' if polyline_elevation else 'clampToGround'
+            for i, coords in enumerate(polylines):
+                # Set altitude mode based on flag
+                altitude_mode = 'absolute' if polyline_elevation else 'clampToGround'
 
-            kml_parts.append(f'''
-        <Placemark>
-            <name>Polyline {i+1}</name>
-            <description>{len(coords)} vertices</description>
-            <styleUrl>#lineStyle</styleUrl>
-            <LineString>
-                <altitudeMode>{altitude_mode}</altitudeMode>
-                <coordinates>
-''')
+                f.write(POLYLINE_PLACEMARK_START.format(
+                    number=i+1, n_vertices=len(coords), altitude_mode=altitude_mode
+                ))
 
-            # Transform all coordinates at once for this polyline
-            coord_strings = []
-            for x, y, z in coords:
-                lon, lat, elev_meters = transform_point(x, y, z, transformer)
+                lons = polyline_lons[i].tolist()
+                lats = polyline_lats[i].tolist()
                 if polyline_elevation:
                     # Include elevation in meters for absolute altitude mode (orthometric height)
-                    coord_strings.append(f'{lon:.10f},{lat:.10f},{elev_meters:.2f}')
+                    coord_lines = ('                    %.10f,%.10f,%.2f\n' % c
+                                   for c in zip(lons, lats, polyline_elevs[i].tolist()))
                 else:
                     # Clamp to ground (elevation = 0)
-                    coord_strings.append(f'{lon:.10f},{lat:.10f},0')
+                    coord_lines = ('                    %.10f,%.10f,0\n' % c for c in zip(lons, lats))
 
-            kml_parts.append('\n'.join(f'                    {c}' for c in coord_strings))
-            kml_parts.append('\n')
+                # Stream vertex lines straight into the file buffer
+                f.writelines(coord_lines)
 
-            kml_parts.append('''                </coordinates>
+                f.write('''                </coordinates>
             </LineString>
         </Placemark>
 ''')
 
-        kml_parts.append('''    </Folder>
+            f.write('''    </Folder>
 ''')
 
-    kml_parts.append('''</Document>
+        f.write('''</Document>
 </kml>
 ''')
 
-    # Write to file
-    print(f"  Writing KML file...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(''.join(kml_parts))
 
     print(f"Created KML file: {output_file}")
-    print(f"  - {len(points)} points")
+    print(f"  - {n_points} points")
     print(f"  - {len(polylines)} polylines")
 
 def convert_dxf_to_kml(dxf_file, output_file=None, start_station=None, end_station=None,
@@ -359,8 +440,7 @@ def convert_dxf_to_kml(dxf_file, output_file=None, start_station=None, end_stati
         output_file = f"{base_name}.kml"
 
     # Extract data from DXF
-    points = extract_points_from_dxf(dxf_file)
-    polylines = extract_polylines_from_dxf(dxf_file)
+    points, polylines = extract_entities_from_dxf(dxf_file)
 
     # Create description
     file_name = os.path.basename(dxf_file)
@@ -374,6 +454,44 @@ def convert_dxf_to_kml(dxf_file, output_file=None, start_station=None, end_stati
 
     return output_file
 
+def convert_file_safely(dxf_file, **options):
+    """
+    Convert one DXF file, reporting missing files and errors instead of raising.
+
+    Args:
+        dxf_file: Path to input DXF file
+        **options: Keyword arguments passed through to convert_dxf_to_kml()
+
+    Returns:
+        str or None: Output KML file path, or None if the conversion failed
+    """
+    if not os.path.exists(dxf_file):
+        print(f"Error: File not found: {dxf_file}")
+        return None
+
+    try:
+        return convert_dxf_to_kml(dxf_file=dxf_file, **options)
+    except Exception as e:
+        print(f"Error processing {dxf_file}: {e}")
+        traceback.print_exc()
+        return None
+
+def init_worker():
+    """Process pool initializer: build the default transformer once per worker."""
+    get_transformer()
+
+def convert_file_report(dxf_file, **options):
+    """
+    Run convert_file_safely() and return everything it printed.
+
+    Used by the worker processes so each file's log can be printed as one
+    block, in input order, by the parent process.
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        convert_file_safely(dxf_file, **options)
+    return buf.getvalue()
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description='Convert DXF files containing retaining wall points to KML format.',
@@ -468,37 +586,29 @@ Station Format:
 
         print(f"Found {len(dxf_files)} DXF files to convert\n")
 
-    # Process each file
-    for i, dxf_file in enumerate(sorted(dxf_files)):
-        if len(dxf_files) > 1:
-            print(f"\n{'='*80}")
-            print(f"[{i+1}/{len(dxf_files)}] Processing: {dxf_file}")
-
-        if not os.path.exists(dxf_file):
-            print(f"Error: File not found: {dxf_file}")
-            continue
-
-        try:
-            # Determine output file
-            output_file = args.output if args.output else None
-
-            # Convert the file
-            result = convert_dxf_to_kml(
-                dxf_file=dxf_file,
-                output_file=output_file,
-                start_station=args.start_station,
-                end_station=args.end_station,
-                include_stations=args.include_stations,
-                polyline_elevation=args.polyline_elevation
-            )
-
-            if len(dxf_files) == 1:
-                print(f"\nSuccess! Output file: {result}")
+    options = dict(
+        output_file=args.output if args.output else None,
+        start_station=args.start_station,
+        end_station=args.end_station,
+        include_stations=args.include_stations,
+        polyline_elevation=args.polyline_elevation
+    )
+    dxf_files = sorted(dxf_files)
 
-        except Exception as e:
-            print(f"Error processing {dxf_file}: {e}")
-            import traceback
-            traceback.print_exc()
+    if len(dxf_files) == 1:
+        result = convert_file_safely(dxf_files[0], **options)
+        if result:
+            print(f"\nSuccess! Output file: {result}")
+    else:
+        # Files are independent: convert them in parallel and print each
+        # file's log in order as it completes
+        with ProcessPoolExecutor(max_workers=min(len(dxf_files), os.cpu_count() or 1),
+                                 initializer=init_worker) as executor:
+            reports = executor.map(partial(convert_file_report, **options), dxf_files)
+            for i, (dxf_file, report) in enumerate(zip(dxf_files, reports)):
+                print(f"\n{'='*80}")
+                print(f"[{i+1}/{len(dxf_files)}] Processing: {dxf_file}")
+                sys.stdout.write(report)
 
     if len(dxf_files) > 1:
         print(f"\n{'='*80}")
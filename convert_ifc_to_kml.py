@@ -11,43 +11,108 @@ Note: IFC base units are meters, so we use EPSG:2767 (CA Zone 2 in meters) direc
 
 import ifcopenshell
 import ifcopenshell.geom
+import ifcopenshell.util.element as ifc_element
+import numpy as np
 from pyproj import Transformer
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+import io
 import os
 import sys
-import math
+import traceback
+from xml.sax.saxutils import escape
 
 
+# KML "lon,lat,0" coordinate formatter, bound once at module level
+COORDINATE_FORMAT = '{},{},0'.format
+
+# Threads used by ifcopenshell's geometry iterator. Pool workers get a share
+# of the cores (see init_worker) so the processes don't each claim all of them
+geometry_threads = os.cpu_count() or 1
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+
+
+@lru_cache(maxsize=None)
 def setup_ifc_settings():
-    """Configure IFC geometry processing settings."""
+    """Configure IFC geometry processing settings (built once per process)."""
     settings = ifcopenshell.geom.settings()
     settings.set(settings.USE_WORLD_COORDS, True)
     settings.set(settings.WELD_VERTICES, False)
     return settings
 
 
-def transform_point(x, y, z, source_epsg='EPSG:2767', target_epsg='EPSG:4326'):
+def transform_points(xs, ys, zs, source_epsg='EPSG:2767', target_epsg='EPSG:4326'):
     """
-    Transform a single point from source CRS to target CRS.
+    Transform points from source CRS to target CRS in one call.
     Transforms horizontal coordinates only; elevation is already in meters.
+    pyproj transforms the whole array in a single C loop.
 
     Note: EPSG:2767 is a 2D horizontal CRS. Elevation values are treated as
     orthometric heights (NAVD88 or similar) and don't require datum transformation.
 
     Args:
-        x, y, z: Coordinates in source CRS (Easting, Northing, Elevation in meters)
+        xs, ys, zs: Arrays of Easting, Northing, Elevation in meters (source CRS)
         source_epsg: Source coordinate system (default: EPSG:2767 - CA State Plane Zone II in meters)
         target_epsg: Target coordinate system (default: EPSG:4326 - WGS84)
 
     Returns:
-        Tuple of (longitude, latitude, elevation_meters)
-            - longitude: WGS84 longitude in decimal degrees
-            - latitude: WGS84 latitude in decimal degrees
-            - elevation_meters: Elevation in meters (same vertical datum, no transformation)
+        Tuple of (longitudes, latitudes, elevations_meters) float64 arrays
     """
-    transformer = Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
-    lon, lat = transformer.transform(x, y)
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    lons, lats = get_transformer(source_epsg, target_epsg).transform(xs, ys)
     # Elevation is already in meters and represents orthometric height
-    return lon, lat, z
+    return lons, lats, np.asarray(zs, dtype=np.float64)
+
+
+def transform_mesh_vertices(coords, source_epsg='EPSG:2767', target_epsg='EPSG:4326'):
+    """
+    Transform an (..., 3) array of mesh vertices, projecting each distinct
+    (x, y) only once. Edges and triangles of a mesh share most of their
+    vertices, so this avoids transforming the same point several times.
+
+    Args:
+        coords: Array of (Easting, Northing, Elevation) vertices in meters, shape (..., 3)
+        source_epsg: Source coordinate system (default: EPSG:2767 - CA State Plane Zone II in meters)
+        target_epsg: Target coordinate system (default: EPSG:4326 - WGS84)
+
+    Returns:
+        Tuple of (longitudes, latitudes) arrays shaped like coords[..., 0]
+    """
+    xy = coords[..., :2].reshape(-1, 2)
+    unique_xy, inverse = np.unique(xy, axis=0, return_inverse=True)
+    lons, lats = get_transformer(source_epsg, target_epsg).transform(unique_xy[:, 0], unique_xy[:, 1])
+
+    # Scatter the unique results back to every vertex
+    inverse = inverse.reshape(-1)
+    shape = coords.shape[:-1]
+    return lons[inverse].reshape(shape), lats[inverse].reshape(shape)
+
+
+def _feature_arrays(features, vertices_per_feature):
+    """
+    Stack collected feature coordinates into one float64 array.
+
+    Args:
+        features: Feature table whose 'coords' is a list of coordinate rows or arrays
+        vertices_per_feature: Vertices per feature (None for single points)
+
+    Returns:
+        The same table with 'coords' as an (N, 3) or (N, vertices_per_feature, 3) array
+    """
+    if vertices_per_feature is None:
+        features['coords'] = np.asarray(features['coords'], dtype=np.float64).reshape(-1, 3)
+    elif features['coords']:
+        features['coords'] = np.concatenate(features['coords'])
+    else:
+        features['coords'] = np.empty((0, vertices_per_feature, 3))
+    return features
 
 
 def extract_geometry_from_ifc(ifc_file):
@@ -58,183 +123,158 @@ def extract_geometry_from_ifc(ifc_file):
         ifc_file: Path to the IFC file
 
     Returns:
-        Dictionary containing lines, points, and other geometric elements
+        Dictionary with the project name and 'lines', 'points' and 'polygons'
+        feature tables. Each table holds a 'coords' array - (N, 2, 3) line
+        segments, (N, 3) points, (N, 3, 3) triangles - plus parallel 'names'
+        and 'types' lists; points also carry 'stations' and 'properties'.
     """
     ifc = ifcopenshell.open(ifc_file)
     settings = setup_ifc_settings()
 
-    lines = []
-    points = []
-    polygons = []
+    # Structure-of-arrays feature tables, stacked into arrays before returning
+    lines = {'coords': [], 'names': [], 'types': []}
+    points = {'coords': [], 'names': [], 'types': [], 'stations': [], 'properties': []}
+    polygons = {'coords': [], 'names': [], 'types': []}
 
     # Get project/site information
     project = ifc.by_type("IfcProject")[0] if ifc.by_type("IfcProject") else None
     project_name = project.Name if project else "IFC Model"
 
-    # First, try to extract points from property sets (common for survey data)
-    # Build a map of elements to their properties
-    element_properties = {}
-
-    for rel in ifc.by_type("IfcRelDefinesByProperties"):
-        pset = rel.RelatingPropertyDefinition
-        if hasattr(pset, 'HasProperties'):
-            for obj in rel.RelatedObjects:
-                if obj.id() not in element_properties:
-                    element_properties[obj.id()] = {}
-
-                # Extract all properties
-                for prop in pset.HasProperties:
-                    if hasattr(prop, 'Name') and hasattr(prop, 'NominalValue'):
-                        prop_name = prop.Name
-                        if hasattr(prop.NominalValue, 'wrappedValue'):
-                            prop_value = prop.NominalValue.wrappedValue
-                        else:
-                            prop_value = str(prop.NominalValue)
-                        element_properties[obj.id()][prop_name] = prop_value
-
-    # Now extract points with all their properties
-    property_sets = ifc.by_type("IfcPropertySet")
-    for pset in property_sets:
-        if hasattr(pset, 'HasProperties'):
-            for prop in pset.HasProperties:
-                if hasattr(prop, 'Name') and prop.Name == 'Start Point':
-                    if hasattr(prop, 'NominalValue') and hasattr(prop.NominalValue, 'wrappedValue'):
-                        coord_str = prop.NominalValue.wrappedValue
-                        # Parse coordinate string like "2081533.5399142911,666940.64371720655,0"
-                        try:
-                            coords = [float(x.strip()) for x in coord_str.split(',')]
-                            if len(coords) >= 3:
-                                # IFC coordinates are X,Y,Z (Easting, Northing, Elevation) in meters
-                                # Get the element this property belongs to
-                                for rel in ifc.by_type("IfcRelDefinesByProperties"):
-                                    if rel.RelatingPropertyDefinition == pset:
-                                        for obj in rel.RelatedObjects:
-                                            # Get station if available
-                                            props = element_properties.get(obj.id(), {})
-                                            station = props.get('Station', '')
-                                            feature_name = props.get('Feature Name', '')
-
-                                            # Use station as name if available, otherwise use feature name or object name
-                                            if station:
-                                                name = f"RW Sta {station}"
-                                            elif feature_name:
-                                                name = feature_name
-                                            elif hasattr(obj, 'Name') and obj.Name:
-                                                name = obj.Name
-                                            else:
-                                                name = f"{obj.is_a()}"
-
-                                            points.append({
-                                                'name': name,
-                                                'type': obj.is_a() if hasattr(obj, 'is_a') else 'Unknown',
-                                                'coords': (coords[0], coords[1], coords[2]),  # Already in meters
-                                                'station': station,
-                                                'properties': props
-                                            })
-                                            break
-                        except:
-                            pass
+    # First, try to extract points from property sets (common for survey data).
+    # get_psets() collects each element's property sets and values in one call.
+    for obj in ifc.by_type("IfcObject"):
+        psets = ifc_element.get_psets(obj, psets_only=True)
+        if not psets:
+            continue
+
+        # Merge all of the element's properties (used for station/name/description)
+        props = {}
+        for pset in psets.values():
+            props.update(pset)
+        props.pop('id', None)
+
+        for pset in psets.values():
+            coord_str = pset.get('Start Point')
+            if not isinstance(coord_str, str):
+                continue
+            # Parse coordinate string like "2081533.5399142911,666940.64371720655,0"
+            try:
+                coords = np.array(coord_str.split(','), dtype=np.float64)
+                if coords.size >= 3:
+                    # IFC coordinates are X,Y,Z (Easting, Northing, Elevation) in meters
+                    # Get station if available
+                    station = props.get('Station', '')
+                    feature_name = props.get('Feature Name', '')
+
+                    # Use station as name if available, otherwise use feature name or object name
+                    if station:
+                        name = f"RW Sta {station}"
+                    elif feature_name:
+                        name = feature_name
+                    elif obj.Name:
+                        name = obj.Name
+                    else:
+                        name = f"{obj.is_a()}"
+
+                    points['coords'].append(coords[:3])  # Already in meters
+                    points['names'].append(name)
+                    points['types'].append(obj.is_a())
+                    points['stations'].append(station)
+                    points['properties'].append(props)
+            except (AttributeError, ValueError, TypeError):
+                pass
 
     # If we found points from properties, return early
-    if points:
+    if points['names']:
         return {
             'project_name': project_name,
-            'lines': lines,
-            'points': points,
-            'polygons': polygons
+            'lines': _feature_arrays(lines, 2),
+            'points': _feature_arrays(points, None),
+            'polygons': _feature_arrays(polygons, 3)
         }
 
     # Otherwise, extract all products with geometric representation
-    products = ifc.by_type("IfcProduct")
-
-    for product in products:
-        try:
-            # Skip if no placement or representation
-            if not hasattr(product, 'ObjectPlacement') or not hasattr(product, 'Representation'):
-                continue
-
-            if product.ObjectPlacement is None or product.Representation is None:
-                continue
-
-            # Try to get geometry
+    products = [
+        product for product in ifc.by_type("IfcProduct")
+        if getattr(product, 'ObjectPlacement', None) is not None
+        and getattr(product, 'Representation', None) is not None
+    ]
+
+    # Create shapes with ifcopenshell's geometry iterator, which builds them on
+    # multiple threads inside the C++ core instead of one create_shape() per product.
+    # Shapes come back in the order the threads finish them, so keep each mesh
+    # by product id and emit the features in product order below
+    meshes = {}
+    iterator = None
+    if products:
+        iterator = ifcopenshell.geom.iterator(settings, ifc, geometry_threads, include=products)
+    if iterator is not None and iterator.initialize():
+        while True:
+            shape = iterator.get()
             try:
-                shape = ifcopenshell.geom.create_shape(settings, product)
                 geometry = shape.geometry
+                meshes[shape.id] = (
+                    np.asarray(geometry.verts, dtype=np.float64).reshape(-1, 3),
+                    np.asarray(geometry.edges, dtype=np.int64),
+                    np.asarray(geometry.faces, dtype=np.int64),
+                )
+            except Exception:
+                # Leave the product to the placement fallback below
+                pass
+
+            if not iterator.next():
+                break
 
-                # Get vertices
-                verts = geometry.verts
-                edges = geometry.edges
-                faces = geometry.faces
-
-                # Group vertices into triplets (x, y, z)
-                vertices = [(verts[i], verts[i+1], verts[i+2]) for i in range(0, len(verts), 3)]
-
-                # Extract lines from edges
-                if edges:
-                    for i in range(0, len(edges), 2):
-                        if i+1 < len(edges):
-                            v1_idx = edges[i]
-                            v2_idx = edges[i+1]
-                            if v1_idx < len(vertices) and v2_idx < len(vertices):
-                                v1 = vertices[v1_idx]
-                                v2 = vertices[v2_idx]
-                                lines.append({
-                                    'name': product.Name or f"{product.is_a()}",
-                                    'type': product.is_a(),
-                                    'points': [v1, v2]
-                                })
-
-                # Extract faces/polygons
-                if faces and len(faces) >= 3:
-                    # Group faces into triangles
-                    for i in range(0, len(faces), 3):
-                        if i+2 < len(faces):
-                            tri_indices = [faces[i], faces[i+1], faces[i+2]]
-                            if all(idx < len(vertices) for idx in tri_indices):
-                                triangle = [vertices[idx] for idx in tri_indices]
-                                polygons.append({
-                                    'name': product.Name or f"{product.is_a()}",
-                                    'type': product.is_a(),
-                                    'points': triangle
-                                })
-
-                # If we have vertices but no edges, treat as points
-                if vertices and not edges and not faces:
-                    for v in vertices:
-                        points.append({
-                            'name': product.Name or f"{product.is_a()}",
-                            'type': product.is_a(),
-                            'coords': v
-                        })
-
-            except Exception as e:
-                # If geometry extraction fails, try to get placement coordinates
-                if hasattr(product, 'ObjectPlacement'):
-                    try:
-                        placement = product.ObjectPlacement
-                        if hasattr(placement, 'RelativePlacement'):
-                            rel_placement = placement.RelativePlacement
-                            if hasattr(rel_placement, 'Location'):
-                                location = rel_placement.Location
-                                if hasattr(location, 'Coordinates'):
-                                    coords = location.Coordinates
-                                    if len(coords) >= 3:
-                                        points.append({
-                                            'name': product.Name or f"{product.is_a()}",
-                                            'type': product.is_a(),
-                                            'coords': (coords[0], coords[1], coords[2])
-                                        })
-                    except:
-                        pass
-
-        except Exception as e:
+    for product in products:
+        name = product.Name or f"{product.is_a()}"
+        product_type = product.is_a()
+
+        mesh = meshes.get(product.id())
+        if mesh is None:
+            # If geometry extraction failed for a product, try to get placement coordinates
+            rel_placement = getattr(product.ObjectPlacement, 'RelativePlacement', None)
+            location = getattr(rel_placement, 'Location', None)
+            coords = getattr(location, 'Coordinates', None)
+            if coords is not None and len(coords) >= 3:
+                points['coords'].append(coords[:3])
+                points['names'].append(name)
+                points['types'].append(product_type)
+                points['stations'].append('N/A')
+                points['properties'].append({})
             continue
 
+        # Vertices as an (N, 3) array of x, y, z
+        vertices, edges, faces = mesh
+        n_verts = len(vertices)
+        vertices_only = n_verts and not len(edges) and not len(faces)
+
+        # Extract lines from edges (pairs of vertex indices)
+        edges = edges[:len(edges) // 2 * 2].reshape(-1, 2)
+        edges = edges[(edges < n_verts).all(axis=1)]
+        lines['coords'].append(vertices[edges])
+        lines['names'].extend([name] * len(edges))
+        lines['types'].extend([product_type] * len(edges))
+
+        # Extract faces/polygons (triples of vertex indices)
+        faces = faces[:len(faces) // 3 * 3].reshape(-1, 3)
+        faces = faces[(faces < n_verts).all(axis=1)]
+        polygons['coords'].append(vertices[faces])
+        polygons['names'].extend([name] * len(faces))
+        polygons['types'].extend([product_type] * len(faces))
+
+        # If we have vertices but no edges, treat as points
+        if vertices_only:
+            points['coords'].extend(vertices)
+            points['names'].extend([name] * n_verts)
+            points['types'].extend([product_type] * n_verts)
+            points['stations'].extend(['N/A'] * n_verts)
+            points['properties'].extend([{}] * n_verts)
+
     return {
         'project_name': project_name,
-        'lines': lines,
-        'points': points,
-        'polygons': polygons
+        'lines': _feature_arrays(lines, 2),
+        'points': _feature_arrays(points, None),
+        'polygons': _feature_arrays(polygons, 3)
     }
 
 
@@ -250,16 +290,22 @@ def create_kml_from_geometry(geometry_data, output_file):
     lines = geometry_data['lines']
     points = geometry_data['points']
     polygons = geometry_data['polygons']
+    n_lines = len(lines['names'])
+    n_points = len(points['names'])
+    n_polygons = len(polygons['names'])
 
     # Extract file name for better layer naming
     import os
     file_basename = os.path.splitext(os.path.basename(output_file))[0]
 
-    # Build KML content
-    kml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Write KML straight to the file as it is generated instead of growing
+    # one string with += (which copies the whole document on every append).
+    # Names and descriptions come from IFC property strings, so escape them.
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
-    <name>{file_basename}</name>
+    <name>{escape(file_basename)}</name>
     <description>Retaining Wall (RW) points from IFC file. Coordinates in EPSG:2767 (CA State Plane Zone II, meters) converted to WGS84.</description>
 
     <Style id="lineStyle">
@@ -292,28 +338,28 @@ def create_kml_from_geometry(geometry_data, output_file):
         <color>7f0000ff</color>
       </PolyStyle>
     </Style>
-'''
+''')
 
-    # Add lines organized in a folder
-    if lines:
-        kml_content += f'''
+        # Add lines organized in a folder
+        if n_lines:
+            f.write(f'''
     <Folder>
       <name>Lines</name>
-      <description>{len(lines)} line features</description>
+      <description>{n_lines} line features</description>
       <open>0</open>
-'''
-        for idx, line in enumerate(lines):
-            name = line['name'] or f"Line {idx+1}"
-            line_type = line['type']
-            coords = []
+''')
+            # Transform every distinct line vertex in one batch; results keep the (N, 2) shape
+            line_lons, line_lats = transform_mesh_vertices(lines['coords'])
 
-            for point in line['points']:
-                lon, lat, elev = transform_point(point[0], point[1], point[2])
-                coords.append(f'{lon},{lat},0')
+            for idx, (name, line_type, lons, lats) in enumerate(
+                zip(lines['names'], lines['types'], line_lons.tolist(), line_lats.tolist())
+            ):
+                name = name or f"Line {idx+1}"
+                coords = list(map(COORDINATE_FORMAT, lons, lats))
 
-            kml_content += f'''
+                f.write(f'''
       <Placemark>
-        <name>{name}</name>
+        <name>{escape(str(name))}</name>
         <description>Type: {line_type}</description>
         <styleUrl>#lineStyle</styleUrl>
         <LineString>
@@ -325,83 +371,85 @@ def create_kml_from_geometry(geometry_data, output_file):
           </coordinates>
         </LineString>
       </Placemark>
-'''
-        kml_content += '''    </Folder>
-'''
+''')
+            f.write('''    </Folder>
+''')
 
-    # Add points organized in a folder
-    if points:
-        kml_content += f'''
+        # Add points organized in a folder
+        if n_points:
+            f.write(f'''
     <Folder>
       <name>Retaining Wall Points</name>
-      <description>{len(points)} retaining wall station points</description>
+      <description>{n_points} retaining wall station points</description>
       <open>1</open>
-'''
-        for idx, point in enumerate(points):
-            name = point['name'] or f"Point {idx+1}"
-            point_type = point['type']
-            lon, lat, elev = transform_point(point['coords'][0], point['coords'][1], point['coords'][2])
-
-            # Build description with properties
-            station = point.get('station', 'N/A')
-            props = point.get('properties', {})
-
-            description_lines = [
-                f"Station: {station}",
-                f"Type: {point_type}",
-                f"Coordinates (State Plane EPSG:2767):",
-                f"  Easting: {point['coords'][0]:.2f} m",
-                f"  Northing: {point['coords'][1]:.2f} m"
-            ]
-
-            # Add additional properties if available
-            if 'Direction' in props:
-                description_lines.append(f"Direction: {props['Direction']}")
-            if 'Length' in props:
-                description_lines.append(f"Length: {props['Length']}")
-            if 'Horizontal Offset' in props:
-                description_lines.append(f"Horizontal Offset: {props['Horizontal Offset']}")
-
-            description = '\n'.join(description_lines)
-
-            kml_content += f'''
+''')
+            # Transform all points in one batch
+            point_coords = points['coords']
+            lons, lats, elevs = transform_points(point_coords[:, 0], point_coords[:, 1], point_coords[:, 2])
+
+            for idx, (name, point_type, station, props, easting, northing, lon, lat) in enumerate(zip(
+                points['names'], points['types'], points['stations'], points['properties'],
+                point_coords[:, 0].tolist(), point_coords[:, 1].tolist(), lons.tolist(), lats.tolist()
+            )):
+                name = name or f"Point {idx+1}"
+
+                # Build description with properties
+                description_lines = [
+                    f"Station: {station}",
+                    f"Type: {point_type}",
+                    f"Coordinates (State Plane EPSG:2767):",
+                    f"  Easting: {easting:.2f} m",
+                    f"  Northing: {northing:.2f} m"
+                ]
+
+                # Add additional properties if available
+                if 'Direction' in props:
+                    description_lines.append(f"Direction: {props['Direction']}")
+                if 'Length' in props:
+                    description_lines.append(f"Length: {props['Length']}")
+                if 'Horizontal Offset' in props:
+                    description_lines.append(f"Horizontal Offset: {props['Horizontal Offset']}")
+
+                description = '\n'.join(description_lines)
+
+                f.write(f'''
       <Placemark>
-        <name>{name}</name>
-        <description>{description}</description>
+        <name>{escape(str(name))}</name>
+        <description>{escape(description)}</description>
         <styleUrl>#rwPointStyle</styleUrl>
         <Point>
           <altitudeMode>clampToGround</altitudeMode>
           <coordinates>{lon},{lat},0</coordinates>
         </Point>
       </Placemark>
-'''
-        kml_content += '''    </Folder>
-'''
+''')
+            f.write('''    </Folder>
+''')
 
-    # Add polygons organized in a folder
-    if polygons:
-        kml_content += f'''
+        # Add polygons organized in a folder
+        if n_polygons:
+            f.write(f'''
     <Folder>
       <name>Polygons</name>
-      <description>{len(polygons)} polygon features</description>
+      <description>{n_polygons} polygon features</description>
       <open>0</open>
-'''
-        for idx, polygon in enumerate(polygons):
-            name = polygon['name'] or f"Polygon {idx+1}"
-            polygon_type = polygon['type']
-            coords = []
+''')
+            # Transform every distinct polygon vertex in one batch; results keep the (N, 3) shape
+            polygon_lons, polygon_lats = transform_mesh_vertices(polygons['coords'])
 
-            for point in polygon['points']:
-                lon, lat, elev = transform_point(point[0], point[1], point[2])
-                coords.append(f'{lon},{lat},0')
+            for idx, (name, polygon_type, lons, lats) in enumerate(
+                zip(polygons['names'], polygons['types'], polygon_lons.tolist(), polygon_lats.tolist())
+            ):
+                name = name or f"Polygon {idx+1}"
+                coords = list(map(COORDINATE_FORMAT, lons, lats))
 
-            # Close the polygon
-            if coords and coords[0] != coords[-1]:
-                coords.append(coords[0])
+                # Close the polygon
+                if coords and coords[0] != coords[-1]:
+                    coords.append(coords[0])
 
-            kml_content += f'''
+                f.write(f'''
       <Placemark>
-        <name>{name}</name>
+        <name>{escape(str(name))}</name>
         <description>Type: {polygon_type}</description>
         <styleUrl>#polygonStyle</styleUrl>
         <Polygon>
@@ -417,22 +465,18 @@ def create_kml_from_geometry(geometry_data, output_file):
           </outerBoundaryIs>
         </Polygon>
       </Placemark>
-'''
-        kml_content += '''    </Folder>
-'''
+''')
+            f.write('''    </Folder>
+''')
 
-    kml_content += '''  </Document>
+        f.write('''  </Document>
 </kml>
-'''
-
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(kml_content)
+''')
 
     print(f"Created KML file: {output_file}")
-    print(f"  Lines: {len(lines)}")
-    print(f"  Points: {len(points)}")
-    print(f"  Polygons: {len(polygons)}")
+    print(f"  Lines: {n_lines}")
+    print(f"  Points: {n_points}")
+    print(f"  Polygons: {n_polygons}")
 
 
 def convert_ifc_to_kml(ifc_file, output_file=None):
@@ -458,6 +502,47 @@ def convert_ifc_to_kml(ifc_file, output_file=None):
     return output_file
 
 
+def convert_file_safely(ifc_file):
+    """
+    Convert one IFC file, reporting missing files and errors instead of raising.
+
+    Args:
+        ifc_file: Path to input IFC file
+
+    Returns:
+        Output KML file path, or None if the conversion failed
+    """
+    if not os.path.exists(ifc_file):
+        print(f"WARNING: File not found: {ifc_file}")
+        return None
+
+    try:
+        return convert_ifc_to_kml(ifc_file)
+    except Exception as e:
+        print(f"ERROR processing {ifc_file}: {e}")
+        traceback.print_exc()
+        return None
+
+
+def init_worker(threads):
+    """Process pool initializer: set this worker's geometry iterator thread count."""
+    global geometry_threads
+    geometry_threads = threads
+
+
+def convert_file_report(ifc_file):
+    """
+    Run convert_file_safely() in a worker process and capture its output.
+
+    Returns:
+        Tuple of (output KML file path or None, everything the conversion printed)
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        kml_file = convert_file_safely(ifc_file)
+    return kml_file, buf.getvalue()
+
+
 def main():
     """Main function to process IFC files."""
 
@@ -484,20 +569,18 @@ def main():
     print("=" * 60)
     print(f"Found {len(ifc_files)} IFC file(s) to convert")
 
-    # Process each IFC file
+    # Process the IFC files in parallel; each file is independent. Logs are
+    # printed per file, in input order, once that file is done.
     kml_files = []
-    for ifc_file in sorted(ifc_files):
-        if not os.path.exists(ifc_file):
-            print(f"WARNING: File not found: {ifc_file}")
-            continue
-
-        try:
-            kml_file = convert_ifc_to_kml(ifc_file)
-            kml_files.append(kml_file)
-        except Exception as e:
-            print(f"ERROR processing {ifc_file}: {e}")
-            import traceback
-            traceback.print_exc()
+    ifc_files = sorted(ifc_files)
+    cpu_count = os.cpu_count() or 1
+    n_workers = min(len(ifc_files), cpu_count)
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=init_worker,
+                             initargs=(max(1, cpu_count // n_workers),)) as executor:
+        for kml_file, report in executor.map(convert_file_report, ifc_files):
+            print(report, end='')
+            if kml_file:
+                kml_files.append(kml_file)
 
     print("\n" + "=" * 60)
     print(f"Conversion complete! Created {len(kml_files)} KML file(s):")
@@ -9,10 +9,24 @@ before passing to pyproj for transformation.
 """
 
 import xml.etree.ElementTree as ET
+from array import array
+import numpy as np
 from pyproj import Transformer
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+from itertools import chain, starmap
+import io
 import os
 import sys
 import math
+from xml.sax.saxutils import escape
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
 
 
 def interpolate_arc(center_x, center_y, start_x, start_y, end_x, end_y, radius, delta, rotation, num_points=50):
@@ -41,130 +55,157 @@ def interpolate_arc(center_x, center_y, start_x, start_y, end_x, end_y, radius,
     if rotation == 'cw':
         delta_rad = -delta_rad
 
-    # Generate points along the arc
-    arc_points = []
-    for i in range(num_points + 1):
-        # Calculate angle for this point
-        fraction = i / num_points
-        angle = start_angle + (delta_rad * fraction)
+    # Generate points along the arc, all angles at once
+    fractions = np.arange(num_points + 1) / num_points
+    angles = start_angle + delta_rad * fractions
+
+    # Calculate points on arc
+    xs = center_x + radius * np.cos(angles)
+    ys = center_y + radius * np.sin(angles)
+
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+def parse_coordinate_pair(text):
+    """
+    Parse a LandXML "Northing Easting" (Y X) string.
+
+    Returns:
+        (easting, northing) tuple (X Y order), or None if the text has fewer than two values
+    """
+    # split() already skips surrounding whitespace; stop after the two values needed
+    coords = text.split(None, 2)
+    if len(coords) < 2:
+        return None
+    return float(coords[1]), float(coords[0])
+
 
-        # Calculate point on arc
-        x = center_x + radius * math.cos(angle)
-        y = center_y + radius * math.sin(angle)
+def parse_line(line, ns):
+    """
+    Extract the start and end points of a LandXML Line element.
 
-        arc_points.append((x, y))
+    Returns:
+        List of (x, y) tuples (Easting, Northing)
+    """
+    points = []
+    for tag in ('landxml:Start', 'landxml:End'):
+        elem = line.find(tag, ns)
+        if elem is not None:
+            point = parse_coordinate_pair(elem.text)
+            if point is not None:
+                points.append(point)
+    return points
 
-    return arc_points
+
+def parse_curve(curve, ns):
+    """
+    Interpolate points along a LandXML Curve element.
+
+    Returns:
+        List of (x, y) tuples (Easting, Northing)
+    """
+    start_elem = curve.find('landxml:Start', ns)
+    end_elem = curve.find('landxml:End', ns)
+    center_elem = curve.find('landxml:Center', ns)
+
+    # Get curve attributes
+    radius = curve.get('radius')
+    delta = curve.get('delta')
+    rotation = curve.get('rot')
+
+    if start_elem is not None and end_elem is not None and center_elem is not None and radius and delta:
+        # Parse start, end and center points (Northing Easting -> Easting Northing)
+        start_x, start_y = parse_coordinate_pair(start_elem.text)
+        end_x, end_y = parse_coordinate_pair(end_elem.text)
+        center_x, center_y = parse_coordinate_pair(center_elem.text)
+
+        # Convert radius and delta to float
+        radius_val = float(radius)
+        delta_val = float(delta)
+
+        # Interpolate points along the arc
+        return interpolate_arc(
+            center_x, center_y,
+            start_x, start_y,
+            end_x, end_y,
+            radius_val, delta_val, rotation,
+            num_points=50
+        )
+
+    # Fallback: if curve data is incomplete, just use start and end
+    return parse_line(curve, ns)
 
 
 def parse_landxml_alignment(xml_file):
     """
     Parse a LandXML file and extract alignment geometry.
 
+    The file is streamed with iterparse: only the first Alignment's CoordGeom
+    is processed, each Line/Curve is freed once read, and parsing stops at
+    the end of that Alignment instead of building the whole document tree.
+
     Args:
         xml_file: Path to the LandXML file
 
     Returns:
-        dict with alignment name and list of coordinate points
+        dict with alignment name and an (N, 2) array of (easting, northing) points
     """
-    # Parse the XML file
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-
     # Define the namespace
     ns = {'landxml': 'http://www.landxml.org/schema/LandXML-1.2'}
-
-    # Find the alignment
-    alignment = root.find('.//landxml:Alignment', ns)
-    if alignment is None:
+    alignment_tag = f"{{{ns['landxml']}}}Alignment"
+    coord_geom_tag = f"{{{ns['landxml']}}}CoordGeom"
+    line_tag = f"{{{ns['landxml']}}}Line"
+    curve_tag = f"{{{ns['landxml']}}}Curve"
+
+    alignment_name = None
+    alignment_desc = ''
+    coord_points = array('d')  # flat easting, northing buffer
+
+    depth = 0
+    coord_geom_depth = None  # depth of the CoordGeom being read, if any
+    coord_geom_done = False
+
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if elem.tag == alignment_tag and alignment_name is None:
+                alignment_name = elem.get('name', 'Unknown')
+                alignment_desc = elem.get('desc', '')
+            elif (elem.tag == coord_geom_tag and alignment_name is not None
+                  and not coord_geom_done and coord_geom_depth is None):
+                coord_geom_depth = depth
+            continue
+
+        depth -= 1
+        if coord_geom_depth is not None and depth == coord_geom_depth:
+            # Direct child of the CoordGeom: extract it in document order
+            # (so consecutive elements join correctly), then free it
+            if elem.tag == line_tag:
+                coord_points.extend(chain.from_iterable(parse_line(elem, ns)))
+            elif elem.tag == curve_tag:
+                coord_points.extend(chain.from_iterable(parse_curve(elem, ns)))
+            elem.clear()
+        elif elem.tag == coord_geom_tag and coord_geom_depth is not None:
+            coord_geom_depth = None
+            coord_geom_done = True
+        elif elem.tag == alignment_tag and alignment_name is not None:
+            # Only the first alignment is used
+            break
+        elif depth == 1:
+            # Free top-level sections (surfaces, point groups, ...) once read
+            elem.clear()
+
+    if alignment_name is None:
         raise ValueError(f"No alignment found in {xml_file}")
 
-    alignment_name = alignment.get('name', 'Unknown')
-    alignment_desc = alignment.get('desc', '')
-
-    # Extract coordinate geometry
-    coord_points = []
-    coord_geom = alignment.find('.//landxml:CoordGeom', ns)
-
-    if coord_geom is not None:
-        # Process Line elements
-        for line in coord_geom.findall('landxml:Line', ns):
-            start = line.find('landxml:Start', ns)
-            end = line.find('landxml:End', ns)
-
-            if start is not None:
-                coords = start.text.strip().split()
-                if len(coords) >= 2:
-                    # XML format is: Northing Easting (Y X)
-                    # Store as: Easting Northing (X Y)
-                    coord_points.append((float(coords[1]), float(coords[0])))
-
-            if end is not None:
-                coords = end.text.strip().split()
-                if len(coords) >= 2:
-                    # XML format is: Northing Easting (Y X)
-                    # Store as: Easting Northing (X Y)
-                    coord_points.append((float(coords[1]), float(coords[0])))
-
-        # Process Curve elements - interpolate points along the arc
-        for curve in coord_geom.findall('landxml:Curve', ns):
-            start_elem = curve.find('landxml:Start', ns)
-            end_elem = curve.find('landxml:End', ns)
-            center_elem = curve.find('landxml:Center', ns)
-
-            # Get curve attributes
-            radius = curve.get('radius')
-            delta = curve.get('delta')
-            rotation = curve.get('rot')
-
-            if start_elem is not None and end_elem is not None and center_elem is not None and radius and delta:
-                # Parse start point (Northing Easting -> Easting Northing)
-                start_coords = start_elem.text.strip().split()
-                start_x = float(start_coords[1])  # Easting
-                start_y = float(start_coords[0])  # Northing
-
-                # Parse end point (Northing Easting -> Easting Northing)
-                end_coords = end_elem.text.strip().split()
-                end_x = float(end_coords[1])  # Easting
-                end_y = float(end_coords[0])  # Northing
-
-                # Parse center point (Northing Easting -> Easting Northing)
-                center_coords = center_elem.text.strip().split()
-                center_x = float(center_coords[1])  # Easting
-                center_y = float(center_coords[0])  # Northing
-
-                # Convert radius and delta to float
-                radius_val = float(radius)
-                delta_val = float(delta)
-
-                # Interpolate points along the arc
-                arc_points = interpolate_arc(
-                    center_x, center_y,
-                    start_x, start_y,
-                    end_x, end_y,
-                    radius_val, delta_val, rotation,
-                    num_points=50
-                )
-
-                # Add all arc points
-                coord_points.extend(arc_points)
-            else:
-                # Fallback: if curve data is incomplete, just use start and end
-                if start_elem is not None:
-                    coords = start_elem.text.strip().split()
-                    if len(coords) >= 2:
-                        coord_points.append((float(coords[1]), float(coords[0])))
-
-                if end_elem is not None:
-                    coords = end_elem.text.strip().split()
-                    if len(coords) >= 2:
-                        coord_points.append((float(coords[1]), float(coords[0])))
-
-    # Remove duplicate consecutive points
-    unique_points = []
-    for point in coord_points:
-        if not unique_points or unique_points[-1] != point:
-            unique_points.append(point)
+    # Remove duplicate consecutive points with one vectorized comparison
+    if coord_points:
+        coords = np.frombuffer(coord_points, dtype=np.float64).reshape(-1, 2)
+    else:
+        coords = np.empty((0, 2))
+    keep = np.ones(len(coords), dtype=bool)
+    keep[1:] = np.any(coords[1:] != coords[:-1], axis=1)
+    unique_points = coords[keep]
 
     return {
         'name': alignment_name,
@@ -181,21 +222,25 @@ def transform_coordinates(points, source_epsg='EPSG:2871', target_epsg='EPSG:432
     LandXML alignment files typically contain only 2D horizontal geometry.
 
     Args:
-        points: List of (easting, northing) tuples in source CRS (X, Y order)
+        points: (N, 2) array or list of (easting, northing) pairs in source CRS (X, Y order)
         source_epsg: Source coordinate system (default: EPSG:2871 - CA State Plane Zone II)
         target_epsg: Target coordinate system (default: EPSG:4326 - WGS84)
 
     Returns:
         List of (lon, lat) tuples in target CRS (2D only)
     """
-    transformer = Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return []
+
+    if source_epsg == target_epsg:
+        # Identity transform: nothing to project
+        return list(map(tuple, points.tolist()))
 
-    transformed_points = []
-    for x, y in points:
-        lon, lat = transformer.transform(x, y)
-        transformed_points.append((lon, lat))
+    # Transform all points in a single pyproj call
+    lons, lats = get_transformer(source_epsg, target_epsg).transform(points[:, 0], points[:, 1])
 
-    return transformed_points
+    return list(zip(lons.tolist(), lats.tolist()))
 
 
 def create_kml(alignment_data, transformed_points, output_file):
@@ -210,12 +255,15 @@ def create_kml(alignment_data, transformed_points, output_file):
     name = alignment_data['name']
     description = alignment_data['description']
 
-    # Build KML content
-    kml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Write KML straight to the file as it is generated instead of growing
+    # one string with += (which copies the whole document on every append).
+    # The alignment name and description are free text, so escape them.
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
-    <name>{name}</name>
-    <description>{description}</description>
+    <name>{escape(name)}</name>
+    <description>{escape(description)}</description>
     <Style id="lineStyle">
       <LineStyle>
         <color>ff0000ff</color>
@@ -223,30 +271,25 @@ def create_kml(alignment_data, transformed_points, output_file):
       </LineStyle>
     </Style>
     <Placemark>
-      <name>Alignment: {name}</name>
-      <description>{description}</description>
+      <name>Alignment: {escape(name)}</name>
+      <description>{escape(description)}</description>
       <styleUrl>#lineStyle</styleUrl>
       <LineString>
         <extrude>0</extrude>
         <tessellate>1</tessellate>
         <altitudeMode>clampToGround</altitudeMode>
         <coordinates>
-'''
+''')
 
-    # Add coordinates (lon,lat,altitude format)
-    for lon, lat in transformed_points:
-        kml_content += f'          {lon},{lat},0\n'
+        # Add coordinates (lon,lat,altitude format)
+        f.writelines(starmap('          {},{},0\n'.format, transformed_points))
 
-    kml_content += '''        </coordinates>
+        f.write('''        </coordinates>
       </LineString>
     </Placemark>
   </Document>
 </kml>
-'''
-
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(kml_content)
+''')
 
     print(f"Created KML file: {output_file}")
     print(f"  Alignment: {name}")
@@ -280,6 +323,23 @@ def convert_landxml_to_kml(xml_file, output_file=None):
     return output_file
 
 
+def convert_file_report(xml_file, output_file):
+    """
+    Convert one LandXML file in a worker process and capture its output.
+
+    Returns:
+        Tuple of (output KML file path or None, everything the conversion printed)
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        try:
+            kml_file = convert_landxml_to_kml(xml_file, output_file)
+        except Exception as e:
+            print(f"ERROR processing {os.path.basename(xml_file)}: {e}")
+            kml_file = None
+    return kml_file, buf.getvalue()
+
+
 def main():
     """Main function to process all XML files in DATA directory."""
     data_dir = 'DATA'
@@ -298,17 +358,18 @@ def main():
     print(f"Found {len(xml_files)} XML file(s) to convert")
     print("=" * 60)
 
-    # Process each XML file
-    kml_files = []
-    for xml_file in sorted(xml_files):
-        xml_path = os.path.join(data_dir, xml_file)
-        kml_path = os.path.join(data_dir, os.path.splitext(xml_file)[0] + '.kml')
+    # Process the XML files in parallel; each file is independent. Logs are
+    # printed per file, in input order, once that file is done.
+    xml_files = sorted(xml_files)
+    xml_paths = [os.path.join(data_dir, xml_file) for xml_file in xml_files]
+    kml_paths = [os.path.join(data_dir, os.path.splitext(xml_file)[0] + '.kml') for xml_file in xml_files]
 
-        try:
-            kml_file = convert_landxml_to_kml(xml_path, kml_path)
-            kml_files.append(kml_file)
-        except Exception as e:
-            print(f"ERROR processing {xml_file}: {e}")
+    kml_files = []
+    with ProcessPoolExecutor(max_workers=min(len(xml_files), os.cpu_count() or 1)) as executor:
+        for kml_file, report in executor.map(convert_file_report, xml_paths, kml_paths):
+            print(report, end='')
+            if kml_file:
+                kml_files.append(kml_file)
 
     print("\n" + "=" * 60)
     print(f"Conversion complete! Created {len(kml_files)} KML file(s):")
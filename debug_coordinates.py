@@ -5,6 +5,10 @@ Debug coordinate systems - check if we're comparing apples to apples.
 
 import math
 
+# US Survey Foot <-> meter conversion factors, computed once
+US_FT_TO_M = 0.3048006096012192
+M_TO_US_FT = 1.0 / US_FT_TO_M
+
 # From Control Points.csv - CM 10.99
 # These are in California State Plane Zone 2, but in what units?
 CM_10_99_RAW = {
@@ -38,11 +42,10 @@ print("If control points are in US Survey Feet and IFC is in meters:")
 print()
 
 # Convert control points from feet to meters
-us_ft_to_m = 0.3048006096012192
 cm_10_99_meters = {
-    'northing': CM_10_99_RAW['northing'] * us_ft_to_m,
-    'easting': CM_10_99_RAW['easting'] * us_ft_to_m,
-    'elevation': CM_10_99_RAW['elevation'] * us_ft_to_m
+    'northing': CM_10_99_RAW['northing'] * US_FT_TO_M,
+    'easting': CM_10_99_RAW['easting'] * US_FT_TO_M,
+    'elevation': CM_10_99_RAW['elevation'] * US_FT_TO_M
 }
 
 print(f"CM 10.99 (original):")
@@ -62,9 +65,9 @@ print()
 
 dx1 = cm_10_99_meters['easting'] - RW_STA_0_RAW['easting']
 dy1 = cm_10_99_meters['northing'] - RW_STA_0_RAW['northing']
-dist1 = math.sqrt(dx1**2 + dy1**2)
+dist1 = math.hypot(dx1, dy1)
 
-print(f"Distance: {dist1:.2f} m = {dist1 / us_ft_to_m:.2f} ft")
+print(f"Distance: {dist1:.2f} m = {dist1 * M_TO_US_FT:.2f} ft")
 print()
 
 print()
@@ -85,9 +88,9 @@ print()
 
 dx2 = CM_10_99_RAW['easting'] - RW_STA_0_RAW['easting']
 dy2 = CM_10_99_RAW['northing'] - RW_STA_0_RAW['northing']
-dist2 = math.sqrt(dx2**2 + dy2**2)
+dist2 = math.hypot(dx2, dy2)
 
-print(f"Distance: {dist2:.2f} m = {dist2 / us_ft_to_m:.2f} ft")
+print(f"Distance: {dist2:.2f} m = {dist2 * M_TO_US_FT:.2f} ft")
 print()
 
 print()
@@ -115,9 +118,9 @@ print()
 
 dx3 = cm_10_99_meters['easting'] - RW_STA_0_SWAPPED['easting']
 dy3 = cm_10_99_meters['northing'] - RW_STA_0_SWAPPED['northing']
-dist3 = math.sqrt(dx3**2 + dy3**2)
+dist3 = math.hypot(dx3, dy3)
 
-print(f"Distance: {dist3:.2f} m = {dist3 / us_ft_to_m:.2f} ft")
+print(f"Distance: {dist3:.2f} m = {dist3 * M_TO_US_FT:.2f} ft")
 print()
 
 print()
@@ -128,8 +131,8 @@ print()
 
 # Convert IFC from feet to meters
 rw_sta_0_if_feet = {
-    'northing': RW_STA_0_RAW['northing'] * us_ft_to_m,
-    'easting': RW_STA_0_RAW['easting'] * us_ft_to_m,
+    'northing': RW_STA_0_RAW['northing'] * US_FT_TO_M,
+    'easting': RW_STA_0_RAW['easting'] * US_FT_TO_M,
     'elevation': RW_STA_0_RAW['elevation']
 }
 
@@ -145,9 +148,9 @@ print()
 
 dx4 = cm_10_99_meters['easting'] - rw_sta_0_if_feet['easting']
 dy4 = cm_10_99_meters['northing'] - rw_sta_0_if_feet['northing']
-dist4 = math.sqrt(dx4**2 + dy4**2)
+dist4 = math.hypot(dx4, dy4)
 
-print(f"Distance: {dist4:.2f} m = {dist4 / us_ft_to_m:.2f} ft")
+print(f"Distance: {dist4:.2f} m = {dist4 * M_TO_US_FT:.2f} ft")
 print()
 
 print()
@@ -155,10 +158,10 @@ print("=" * 80)
 print("SUMMARY")
 print("=" * 80)
 print()
-print(f"Hypothesis 1 (CP in ft, IFC in m):              {dist1 / us_ft_to_m:10.2f} ft")
-print(f"Hypothesis 2 (both in m):                       {dist2 / us_ft_to_m:10.2f} ft")
-print(f"Hypothesis 3 (IFC coords swapped):              {dist3 / us_ft_to_m:10.2f} ft")
-print(f"Hypothesis 4 (IFC in ft, should be m):          {dist4 / us_ft_to_m:10.2f} ft")
+print(f"Hypothesis 1 (CP in ft, IFC in m):              {dist1 * M_TO_US_FT:10.2f} ft")
+print(f"Hypothesis 2 (both in m):                       {dist2 * M_TO_US_FT:10.2f} ft")
+print(f"Hypothesis 3 (IFC coords swapped):              {dist3 * M_TO_US_FT:10.2f} ft")
+print(f"Hypothesis 4 (IFC in ft, should be m):          {dist4 * M_TO_US_FT:10.2f} ft")
 print()
 print(f"User reports measuring: ~41 ft")
 print(f"User expects: ~83 ft")
@@ -166,10 +169,10 @@ print()
 
 # Check which is closest to either value
 hypotheses = [
-    ("H1 (CP in ft, IFC in m)", dist1 / us_ft_to_m),
-    ("H2 (both in m)", dist2 / us_ft_to_m),
-    ("H3 (IFC swapped)", dist3 / us_ft_to_m),
-    ("H4 (IFC in ft)", dist4 / us_ft_to_m)
+    ("H1 (CP in ft, IFC in m)", dist1 * M_TO_US_FT),
+    ("H2 (both in m)", dist2 * M_TO_US_FT),
+    ("H3 (IFC swapped)", dist3 * M_TO_US_FT),
+    ("H4 (IFC in ft)", dist4 * M_TO_US_FT)
 ]
 
 print("Closest to 41 ft:")
@@ -6,12 +6,23 @@ The problem: Distance is ~41 ft but should be ~83 ft (exactly 2x).
 This suggests a scale factor or projection issue.
 """
 
+from functools import lru_cache
 from pyproj import Transformer, CRS
 import math
 
+# Build the CRS objects once at import
+CRS_2767 = CRS.from_epsg(2767)  # CA State Plane Zone 2, meters
+CRS_2871 = CRS.from_epsg(2871)  # CA State Plane Zone 2, US Survey Feet
+CRS_WGS84 = CRS.from_epsg(4326)
+
+@lru_cache(maxsize=None)
+def get_transformer(source_epsg, target_epsg):
+    """Return a cached 2D (always_xy) transformer for a source/target CRS pair."""
+    return Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+
 def calculate_distance_2d(x1, y1, x2, y2):
     """Calculate 2D Euclidean distance."""
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 def main():
     print("=" * 80)
@@ -30,14 +41,26 @@ def main():
     print(f"  CM 10.99:         N={cm_north_ft:.2f}, E={cm_east_ft:.2f} (EPSG:2871, feet)")
     print(f"  RW Sta 0+032.67:  X={rw_x:.4f}, Y={rw_y:.4f} (units unknown)")
 
+    # IFC coords scaled by 2 and by 0.5 (test 9)
+    rw_x_scaled = rw_x * 2
+    rw_y_scaled = rw_y * 2
+    rw_x_half = rw_x * 0.5
+    rw_y_half = rw_y * 0.5
+
+    # Every EPSG:2767 -> EPSG:2871 input the tests need, transformed in one
+    # batch: as-is (tests 1 and 5A), X/Y swapped (test 6), scaled x2 and x0.5 (test 9)
+    batch_east, batch_north = get_transformer(CRS_2767, CRS_2871).transform(
+        [rw_x, rw_y, rw_x_scaled, rw_x_half],
+        [rw_y, rw_x, rw_y_scaled, rw_y_half]
+    )
+    rw_east_ft, rw_e_swap, rw_e_scaled, rw_e_half = batch_east
+    rw_north_ft, rw_n_swap, rw_n_scaled, rw_n_half = batch_north
+
     # Test 1: Transform IFC from EPSG:2767 (meters) to EPSG:2871 (feet)
     print("\n" + "-" * 80)
     print("TEST 1: Current approach (EPSG:2767 meters -> EPSG:2871 feet)")
     print("-" * 80)
 
-    trans_2767_to_2871 = Transformer.from_crs('EPSG:2767', 'EPSG:2871', always_xy=True)
-    rw_east_ft, rw_north_ft = trans_2767_to_2871.transform(rw_x, rw_y)
-
     print(f"  Transformed: N={rw_north_ft:.2f}, E={rw_east_ft:.2f}")
 
     dist_test1 = calculate_distance_2d(cm_east_ft, cm_north_ft, rw_east_ft, rw_north_ft)
@@ -58,20 +81,17 @@ def main():
     print("TEST 3: Examine CRS definitions")
     print("-" * 80)
 
-    crs_2767 = CRS.from_epsg(2767)
-    crs_2871 = CRS.from_epsg(2871)
-
     print(f"\nEPSG:2767:")
-    print(f"  Name: {crs_2767.name}")
-    print(f"  Units: {crs_2767.axis_info[0].unit_name}")
-    print(f"  Axis 1: {crs_2767.axis_info[0].name} ({crs_2767.axis_info[0].direction})")
-    print(f"  Axis 2: {crs_2767.axis_info[1].name} ({crs_2767.axis_info[1].direction})")
+    print(f"  Name: {CRS_2767.name}")
+    print(f"  Units: {CRS_2767.axis_info[0].unit_name}")
+    print(f"  Axis 1: {CRS_2767.axis_info[0].name} ({CRS_2767.axis_info[0].direction})")
+    print(f"  Axis 2: {CRS_2767.axis_info[1].name} ({CRS_2767.axis_info[1].direction})")
 
     print(f"\nEPSG:2871:")
-    print(f"  Name: {crs_2871.name}")
-    print(f"  Units: {crs_2871.axis_info[0].unit_name}")
-    print(f"  Axis 1: {crs_2871.axis_info[0].name} ({crs_2871.axis_info[0].direction})")
-    print(f"  Axis 2: {crs_2871.axis_info[1].name} ({crs_2871.axis_info[1].direction})")
+    print(f"  Name: {CRS_2871.name}")
+    print(f"  Units: {CRS_2871.axis_info[0].unit_name}")
+    print(f"  Axis 1: {CRS_2871.axis_info[0].name} ({CRS_2871.axis_info[0].direction})")
+    print(f"  Axis 2: {CRS_2871.axis_info[1].name} ({CRS_2871.axis_info[1].direction})")
 
     # Test 4: Manual conversion check
     print("\n" + "-" * 80)
@@ -98,8 +118,7 @@ def main():
     print("-" * 80)
 
     # Method A: Direct EPSG:2767 -> EPSG:2871
-    trans_a = Transformer.from_crs('EPSG:2767', 'EPSG:2871', always_xy=True)
-    rw_e_a, rw_n_a = trans_a.transform(rw_x, rw_y)
+    rw_e_a, rw_n_a = rw_east_ft, rw_north_ft
     dist_a = calculate_distance_2d(cm_east_ft, cm_north_ft, rw_e_a, rw_n_a)
 
     print(f"\n  Method A: Direct 2767->2871")
@@ -107,10 +126,8 @@ def main():
     print(f"    Distance: {dist_a:.2f} ft")
 
     # Method B: Via WGS84 (2767 -> 4326 -> 2871)
-    trans_b1 = Transformer.from_crs('EPSG:2767', 'EPSG:4326', always_xy=True)
-    trans_b2 = Transformer.from_crs('EPSG:4326', 'EPSG:2871', always_xy=True)
-    lon, lat = trans_b1.transform(rw_x, rw_y)
-    rw_e_b, rw_n_b = trans_b2.transform(lon, lat)
+    lon, lat = get_transformer(CRS_2767, CRS_WGS84).transform(rw_x, rw_y)
+    rw_e_b, rw_n_b = get_transformer(CRS_WGS84, CRS_2871).transform(lon, lat)
     dist_b = calculate_distance_2d(cm_east_ft, cm_north_ft, rw_e_b, rw_n_b)
 
     print(f"\n  Method B: Via WGS84 (2767->4326->2871)")
@@ -125,9 +142,7 @@ def main():
     print("TEST 6: What if X/Y are swapped in IFC file?")
     print("-" * 80)
 
-    # Try swapping X and Y
-    trans_swap = Transformer.from_crs('EPSG:2767', 'EPSG:2871', always_xy=True)
-    rw_e_swap, rw_n_swap = trans_swap.transform(rw_y, rw_x)  # Swapped!
+    # Try swapping X and Y (transformed with the batch above)
     dist_swap = calculate_distance_2d(cm_east_ft, cm_north_ft, rw_e_swap, rw_n_swap)
 
     print(f"  With X/Y swapped:")
@@ -143,14 +158,14 @@ def main():
 
     # Get projection strings
     print(f"\nEPSG:2767 WKT:")
-    wkt_2767 = crs_2767.to_wkt(pretty=True)
+    wkt_2767 = CRS_2767.to_wkt(pretty=True)
     # Look for scale factor
     for line in wkt_2767.split('\n'):
         if 'scale' in line.lower() or 'factor' in line.lower():
             print(f"  {line.strip()}")
 
     print(f"\nEPSG:2871 WKT:")
-    wkt_2871 = crs_2871.to_wkt(pretty=True)
+    wkt_2871 = CRS_2871.to_wkt(pretty=True)
     for line in wkt_2871.split('\n'):
         if 'scale' in line.lower() or 'factor' in line.lower():
             print(f"  {line.strip()}")
@@ -170,7 +185,7 @@ def main():
     delta_e = rw_east_ft - cm_east_ft
 
     # Magnitude (current distance)
-    mag_current = math.sqrt(delta_n**2 + delta_e**2)
+    mag_current = math.hypot(delta_n, delta_e)
 
     # For 83 ft, we need 2x the distance
     scale_needed = 83.0 / dist_test1
@@ -190,8 +205,7 @@ def main():
     print(f"  Target RW position (EPSG:2871): N={rw_north_target:.2f}, E={rw_east_target:.2f}")
 
     # Now transform this target position back to EPSG:2767
-    trans_back = Transformer.from_crs('EPSG:2871', 'EPSG:2767', always_xy=True)
-    rw_x_target, rw_y_target = trans_back.transform(rw_east_target, rw_north_target)
+    rw_x_target, rw_y_target = get_transformer(CRS_2871, CRS_2767).transform(rw_east_target, rw_north_target)
 
     print(f"\n  Target coords in EPSG:2767 (if that's the source): X={rw_x_target:.4f}, Y={rw_y_target:.4f}")
     print(f"  Actual IFC coords:                                 X={rw_x:.4f}, Y={rw_y:.4f}")
@@ -203,10 +217,6 @@ def main():
     print("-" * 80)
 
     # Try scaling IFC coords by 2
-    rw_x_scaled = rw_x * 2
-    rw_y_scaled = rw_y * 2
-
-    rw_e_scaled, rw_n_scaled = trans_2767_to_2871.transform(rw_x_scaled, rw_y_scaled)
     dist_scaled = calculate_distance_2d(cm_east_ft, cm_north_ft, rw_e_scaled, rw_n_scaled)
 
     print(f"  IFC coords × 2:")
@@ -215,10 +225,6 @@ def main():
     print(f"    Distance: {dist_scaled:.2f} ft")
 
     # Try scaling by 0.5
-    rw_x_half = rw_x * 0.5
-    rw_y_half = rw_y * 0.5
-
-    rw_e_half, rw_n_half = trans_2767_to_2871.transform(rw_x_half, rw_y_half)
     dist_half = calculate_distance_2d(cm_east_ft, cm_north_ft, rw_e_half, rw_n_half)
 
     print(f"\n  IFC coords × 0.5:")
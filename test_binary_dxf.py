@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test that convert_dxf_to_kml reads binary DXF files.
+Saves a sample DXF from the DATA directory in binary format and checks that
+extract_entities_from_dxf returns the same points and polylines as for the
+ASCII original.
+"""
+
+import os
+import sys
+import tempfile
+
+import ezdxf
+import numpy as np
+
+from convert_dxf_to_kml import extract_entities_from_dxf
+
+SAMPLE_DXF = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'DATA', '4.013_PR_RW Points_S-BD_RW1.dxf')
+
+
+def test_binary_dxf_matches_ascii():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binary_dxf = os.path.join(tmp_dir, 'binary.dxf')
+        ezdxf.readfile(SAMPLE_DXF).saveas(binary_dxf, fmt='bin')
+
+        ascii_points, ascii_polylines = extract_entities_from_dxf(SAMPLE_DXF)
+        binary_points, binary_polylines = extract_entities_from_dxf(binary_dxf)
+
+    # Coordinate arrays, then layer names
+    for ascii_coords, binary_coords in zip(ascii_points[:3], binary_points[:3]):
+        assert np.array_equal(ascii_coords, binary_coords)
+    assert ascii_points[3] == binary_points[3]
+    assert ascii_polylines == binary_polylines
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("BINARY DXF TEST")
+    print("=" * 80)
+    try:
+        test_binary_dxf_matches_ascii()
+    except AssertionError:
+        print("\nFAIL: binary DXF entities differ from the ASCII original")
+        sys.exit(1)
+    print("\nPASS: binary DXF entities match the ASCII original")